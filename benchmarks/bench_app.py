@@ -0,0 +1,223 @@
+"""
+End-to-end benchmark of the dashboard with Streamlit's headless AppTest.
+
+Reports the cold-start time of the app (first run of the default page in a
+fresh process) and, for every page, the first-render latency with cold caches,
+the warm-rerun latency and peak memory. Every measurement runs in a fresh
+Python process, fully offline against the files under Data/, and the results
+are written as JSON so runs from different commits can be compared.
+
+Usage: python benchmarks/bench_app.py [--reruns N] [--output FILE] [--compare BASELINE.json]
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(BASE_DIR, 'rofacts.py')
+RESULTS_DIR = os.path.join(BASE_DIR, 'benchmarks', 'results')
+
+# Page name (as in st.session_state.current_page) -> page script
+PAGES = {
+    'Home': 'views/home.py',
+    'Economy': 'views/economy.py',
+    'Peer countries': 'views/peers.py',
+    'Government spending': 'views/government_spending.py',
+    'Health': 'views/health.py',
+    'Population': 'views/population.py',
+    'About': 'views/about.py',
+}
+# Pages without data, used to park the app before the measured page is rendered
+SHELL_PAGES = ('About', 'Government spending')
+
+TIMEOUT = 120
+
+
+def _run(at):
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"App raised: {at.exception}")
+    return at
+
+
+def _switch(at, page):
+    _run(at.switch_page(PAGES[page]))
+    if at.session_state.current_page != page:
+        raise RuntimeError(f"Expected page {page}, got {at.session_state.current_page}")
+    return at
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def _start_app(page):
+    """
+    Start the app in this (fresh) process and park it on a light page with empty caches,
+    so the next switch to `page` renders it with warm imports but cold data and figures.
+    Returns the app and the cold-start time of the first (default page) run.
+    """
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    start = time.perf_counter()
+    at = _run(AppTest.from_file(APP, default_timeout=TIMEOUT))
+    cold_start = (time.perf_counter() - start) * 1000
+
+    _switch(at, next(name for name in SHELL_PAGES if name != page))
+    # The first run started the background warm-up (see warmup.py); let it finish before emptying the caches
+    sys.modules['warmup'].ready.wait(TIMEOUT)
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    return at, cold_start
+
+
+def measure_page_latency(page, reruns):
+    at, cold_start = _start_app(page)
+
+    start = time.perf_counter()
+    _switch(at, page)
+    first_render = (time.perf_counter() - start) * 1000
+
+    warm = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        _run(at)
+        warm.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'cold_start_ms': cold_start,
+        'first_render_ms': first_render,
+        'warm_rerun_ms': {
+            'median': statistics.median(warm),
+            'p95': _percentile(warm, 0.95),
+            'min': min(warm),
+        },
+    }
+
+
+def measure_page_memory(page, reruns):
+    at, _ = _start_app(page)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # tracemalloc only sees Python allocations; Arrow buffers show up in the RSS growth
+    tracemalloc.start()
+    _switch(at, page)
+    for _ in range(reruns):
+        _run(at)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss_unit = 1 if sys.platform == 'darwin' else 1024
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'peak_alloc_mb': peak / 2**20,
+        'max_rss_mb': rss_after * rss_unit / 2**20,
+        'rss_growth_mb': (rss_after - rss_before) * rss_unit / 2**20,
+    }
+
+
+def _in_subprocess(*args):
+    """Run one measurement in a fresh interpreter and return its JSON result"""
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', *map(str, args)],
+        cwd=BASE_DIR, capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Measurement {args} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _worker(args):
+    kind = args[0]
+    # Keep Streamlit's own log lines out of the JSON on stdout
+    sys.stdout, real_stdout = sys.stderr, sys.stdout
+    if kind == 'latency':
+        result = measure_page_latency(args[1], int(args[2]))
+    else:
+        result = measure_page_memory(args[1], int(args[2]))
+    real_stdout.write(json.dumps(result) + '\n')
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(results, baseline):
+    """Print the relative change of every headline number against a previous run"""
+    def change(new, old):
+        return f"{(new - old) / old * 100:+.1f}%" if old else 'n/a'
+
+    print(f"\nChange vs {baseline.get('commit', '?')}:")
+    print(f"  cold start: {change(results['cold_start_ms'], baseline['cold_start_ms'])}")
+    for page, stats in results['pages'].items():
+        old = baseline['pages'].get(page)
+        if not old:
+            continue
+        print(f"  {page:<20} first {change(stats['first_render_ms'], old['first_render_ms']):>8}"
+              f"  warm {change(stats['warm_rerun_ms']['median'], old['warm_rerun_ms']['median']):>8}"
+              f"  peak {change(stats['peak_alloc_mb'], old['peak_alloc_mb']):>8}")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        return _worker(sys.argv[2:])
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--reruns', type=int, default=10, help="warm reruns per page")
+    parser.add_argument('--output', help="results file (default: benchmarks/results/app-<commit>.json)")
+    parser.add_argument('--compare', help="previous results file to compare against")
+    parser.add_argument('--pages', nargs='*', default=list(PAGES), help="pages to measure (default: all)")
+    args = parser.parse_args()
+
+    commit = _git_commit()
+    import streamlit
+    results = {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'reruns': args.reruns,
+        'pages': {},
+    }
+    print(f"{'page':<22}{'first (ms)':>12}{'warm p50':>10}{'warm p95':>10}{'peak MB':>9}{'RSS MB':>8}")
+    for page in args.pages:
+        stats = _in_subprocess('latency', page, args.reruns)
+        stats.update(_in_subprocess('memory', page, args.reruns))
+        results['pages'][page] = stats
+        print(f"{page:<22}{stats['first_render_ms']:>12.1f}{stats['warm_rerun_ms']['median']:>10.1f}"
+              f"{stats['warm_rerun_ms']['p95']:>10.1f}{stats['peak_alloc_mb']:>9.1f}{stats['max_rss_mb']:>8.0f}")
+
+    # Every page is measured in a fresh process, each of which starts the app once
+    cold_starts = [stats.pop('cold_start_ms') for stats in results['pages'].values()]
+    results['cold_start_ms'] = statistics.median(cold_starts)
+    print(f"\ncold start (median of {len(cold_starts)}): {results['cold_start_ms']:.0f} ms")
+
+    output = args.output or os.path.join(RESULTS_DIR, f'app-{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {os.path.relpath(output)}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
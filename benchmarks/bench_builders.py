@@ -0,0 +1,218 @@
+"""
+Microbenchmarks of the chart builders and data loaders at growing input sizes.
+
+Every builder and loader is timed in isolation on today's files and on
+synthetic datasets 100x and 1000x larger, together with its tracemalloc peak
+and the size of what it produces (figure JSON for builders, frame memory for
+loaders). The growth exponent between the two largest sizes shows which
+functions are super-linear before they are fed bigger data.
+
+Usage: python benchmarks/bench_builders.py [--scales 1 100 1000] [--repeat N] [--output FILE]
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import charts  # noqa: E402
+import datastore  # noqa: E402
+import dataversion  # noqa: E402
+import loaders  # noqa: E402
+
+# Builder -> (dataset it takes, call)
+BUILDERS = {
+    'create_population_pyramid': ('population', charts.create_population_pyramid),
+    'create_life_expectancy_chart': ('life_expectancy', charts.create_life_expectancy_chart),
+    'RomaniaGDPAnalyzer.create_gdp_plotly_chart': ('gdp', lambda df: charts.RomaniaGDPAnalyzer().create_gdp_plotly_chart(df)),
+    'create_wage_chart': ('real_wage', charts.create_wage_chart),
+    'create_monthly_wage_chart': ('monthly_wage', charts.create_monthly_wage_chart),
+}
+
+# Loader in loaders.py -> dataset it serves
+LOADERS = {
+    'load_gdp_data': 'gdp',
+    'load_wage_data': 'real_wage',
+    'load_monthly_wage_data': 'monthly_wage',
+    'load_life_expectancy_data': 'life_expectancy',
+}
+
+# A function whose time grows faster than n^SUPERLINEAR between the two largest sizes is flagged
+SUPERLINEAR = 1.2
+
+
+def best_of(func, repeat, budget=2.0):
+    """Best wall time of up to `repeat` calls in milliseconds; stops early once `budget` seconds are spent"""
+    timings = []
+    deadline = time.perf_counter() + budget
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+        if time.perf_counter() > deadline:
+            break
+    return min(timings) * 1000
+
+
+def peak_allocation(func):
+    """tracemalloc peak of one call in bytes, and the call's result"""
+    tracemalloc.start()
+    try:
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak, result
+
+
+def synthetic(name, df, factor):
+    """
+    `factor` copies of a dataset one after the other, with the period column
+    continuing past the real data and the float columns jittered.
+    """
+    if factor == 1:
+        return df
+    big = pd.concat([df] * factor, ignore_index=True)
+    rng = np.random.default_rng(0)
+    for column in big.select_dtypes('float').columns:
+        big[column] = big[column] * rng.uniform(0.95, 1.05, len(big))
+
+    if name == 'monthly_wage':
+        # A monthly series this long would overflow datetime64[ns]; hourly steps keep it in range
+        big['Month'] = pd.date_range(df['Month'].iloc[0], periods=len(big), freq='h')
+    elif name == 'population':
+        copy = np.repeat(np.arange(factor), len(df)).astype(str)
+        big['Age_group'] = big['Age_group'] + ' #' + copy
+    else:
+        year = 'year' if name == 'gdp' else 'Year'
+        rows_per_year = len(df) // df[year].nunique()
+        big[year] = int(df[year].iloc[0]) + np.arange(len(big)) // rows_per_year
+    return big
+
+
+def write_sources(datasets, directory):
+    """Write frames as the source files of the data store, in each dataset's own format"""
+    for name, df in datasets.items():
+        path = os.path.join(directory, datastore.DATASETS[name]['source'])
+        if path.endswith('.csv'):
+            df.to_csv(path, index=False)
+        else:
+            df.to_excel(path, index=False)
+
+
+def bench_builders(datasets, repeat):
+    results = {}
+    for builder, (name, build) in BUILDERS.items():
+        df = datasets[name]
+        peak, fig = peak_allocation(lambda: build(df))
+        results[builder] = {
+            'rows': len(df),
+            'ms': best_of(lambda: build(df), repeat),
+            'json_ms': best_of(fig.to_json, repeat),
+            'peak_bytes': peak,
+            'size_bytes': len(fig.to_json()),
+        }
+    return results
+
+
+def bench_loaders(datasets, directory, repeat):
+    """Time the source parse and the cached loaders against source files in `directory`"""
+    datastore.DATA_DIR = directory
+    datastore.COMPILED_DIR = os.path.join(directory, 'compiled')
+    write_sources(datasets, directory)
+    dataversion.refresh()
+
+    results = {}
+    for name in datasets:
+        peak, df = peak_allocation(lambda: datastore.read_source(name))
+        datastore.write_compiled(name, df, datastore.compiled_version(name))
+        results[f'read_source({name})'] = {
+            # Input rows: the gdp query drops the synthetic years past 2025
+            'rows': len(datasets[name]),
+            'ms': best_of(lambda: datastore.read_source(name), repeat),
+            'peak_bytes': peak,
+            'size_bytes': int(df.memory_usage(deep=True).sum()),
+        }
+
+    for loader, name in LOADERS.items():
+        load = getattr(loaders, loader)
+
+        def cold_load():
+            loaders.load_shared_dataset.clear()
+            return load()
+
+        peak, df = peak_allocation(cold_load)
+        results[f'{loader} (miss)'] = {
+            'rows': len(datasets[name]),
+            'ms': best_of(cold_load, repeat),
+            'peak_bytes': peak,
+            'size_bytes': int(df.memory_usage(deep=True).sum()),
+        }
+        load()
+        peak, df = peak_allocation(load)
+        results[f'{loader} (hit)'] = {
+            'rows': len(datasets[name]),
+            'ms': best_of(load, repeat),
+            'peak_bytes': peak,
+            'size_bytes': int(df.memory_usage(deep=True).sum()),
+        }
+    return results
+
+
+def growth_exponent(results, scales, function):
+    """Exponent k of time ~ n^k between the two largest sizes"""
+    small, large = results[scales[-2]][function], results[scales[-1]][function]
+    if small['ms'] <= 0 or large['rows'] == small['rows']:
+        return None
+    return math.log(large['ms'] / small['ms']) / math.log(large['rows'] / small['rows'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help="also write the results as JSON to this file")
+    args = parser.parse_args()
+    scales = sorted(set(args.scales))
+
+    # Only the datasets a builder or loader here takes
+    used = {dataset for dataset, _ in BUILDERS.values()} | set(LOADERS.values())
+    base = {name: datastore.load(name) for name in datastore.DATASETS if name in used}
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for factor in scales:
+            datasets = {name: synthetic(name, df, factor) for name, df in base.items()}
+            directory = os.path.join(tmp, f'x{factor}')
+            os.makedirs(directory)
+            results[factor] = bench_builders(datasets, args.repeat)
+            results[factor].update(bench_loaders(datasets, directory, args.repeat))
+
+    print(f"{'function':<46}{'scale':>7}{'rows':>9}{'ms':>11}{'json ms':>9}{'peak MB':>9}{'size KB':>10}")
+    for function in results[scales[0]]:
+        for factor in scales:
+            stats = results[factor][function]
+            json_ms = f"{stats['json_ms']:.2f}" if 'json_ms' in stats else '-'
+            print(f"{function if factor == scales[0] else '':<46}{factor:>6}x{stats['rows']:>9}{stats['ms']:>11.2f}"
+                  f"{json_ms:>9}{stats['peak_bytes'] / 2**20:>9.2f}{stats['size_bytes'] / 1024:>10.1f}")
+        if len(scales) > 1:
+            exponent = growth_exponent(results, scales, function)
+            if exponent is not None:
+                flag = '  <- super-linear' if exponent > SUPERLINEAR else ''
+                print(f"{'':<46}time ~ n^{exponent:.2f}{flag}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({str(factor): stats for factor, stats in results.items()}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Compare load times of the compiled Arrow store against parsing the source files.
+
+Usage: python benchmarks/bench_datastore.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import datastore  # noqa: E402
+
+
+def best_of(func, repeat):
+    """Best wall time of `repeat` calls, in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    for name in datastore.DATASETS:
+        datastore.compile_dataset(name)
+
+    print(f"{'dataset':<18}{'source (ms)':>14}{'compiled (ms)':>16}{'speedup':>10}")
+    for name in datastore.DATASETS:
+        source_ms = best_of(lambda: datastore.read_source(name), args.repeat)
+        compiled_ms = best_of(lambda: datastore.read_compiled(name), args.repeat)
+        print(f"{name:<18}{source_ms:>14.2f}{compiled_ms:>16.2f}{source_ms / compiled_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark the vectorized JSON-stat decoder on a large synthetic Eurostat-like cube.
+
+The fixture mimics demo_mlexpec for every age, sex, year and EU country, and
+the decoder is compared with the per-key loop of Code/life_expectancy.ipynb.
+
+Usage: python benchmarks/bench_jsonstat.py [--countries N] [--years N] [--skip-loop]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jsonstat  # noqa: E402
+
+
+def synthetic_cube(countries, years, ages=86, missing=0.05, seed=0):
+    """JSON-stat dataset with freq x unit x sex x age x geo x time cells, some of them missing"""
+    dimensions = {
+        'freq': ['A'],
+        'unit': ['YR'],
+        'sex': ['F', 'M', 'T'],
+        'age': ['Y_LT1'] + [f'Y{i}' for i in range(1, ages)],
+        'geo': [f'C{i:03d}' for i in range(countries)],
+        'time': [str(1960 + i) for i in range(years)],
+    }
+    sizes = [len(codes) for codes in dimensions.values()]
+    cells = int(np.prod(sizes))
+
+    rng = np.random.default_rng(seed)
+    present = np.flatnonzero(rng.random(cells) >= missing)
+    values = np.round(rng.uniform(50, 90, len(present)), 1)
+
+    return {
+        'version': '2.0',
+        'class': 'dataset',
+        'id': list(dimensions),
+        'size': sizes,
+        'value': dict(zip(map(str, present.tolist()), values.tolist())),
+        'dimension': {
+            dim: {'category': {
+                'index': {code: i for i, code in enumerate(codes)},
+                'label': {code: f'{dim} {code}' for code in codes},
+            }}
+            for dim, codes in dimensions.items()
+        },
+    }
+
+
+def loop_decode(data):
+    """The notebook approach: decode every key in Python"""
+    dim_names = list(data['dimension'].keys())
+    dim_sizes = [len(data['dimension'][dim]['category']['index']) for dim in dim_names]
+    labels = {dim: list(data['dimension'][dim]['category']['label'].values()) for dim in dim_names}
+
+    records = []
+    for key_str, value in data['value'].items():
+        if value is None:
+            continue
+        key_num = int(key_str)
+        indices = []
+        for size in reversed(dim_sizes):
+            indices.append(key_num % size)
+            key_num //= size
+        indices.reverse()
+        record = {dim: labels[dim][i] for dim, i in zip(dim_names, indices)}
+        record['value'] = value
+        records.append(record)
+    return records
+
+
+def measure(func, data):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(data)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed * 1000, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--countries', type=int, default=27)
+    parser.add_argument('--years', type=int, default=64)
+    parser.add_argument('--skip-loop', action='store_true', help="only time the vectorized decoder")
+    args = parser.parse_args()
+
+    data = synthetic_cube(args.countries, args.years)
+    size_mb = len(json.dumps(data)) / 2**20
+    print(f"fixture: {len(data['value']):,} cells, {size_mb:.1f} MB of JSON")
+
+    df, elapsed, peak = measure(jsonstat.decode, data)
+    print(f"vectorized: {elapsed:9.1f} ms, peak {peak:7.1f} MB, frame {df.memory_usage(deep=True).sum() / 2**20:.1f} MB")
+
+    if not args.skip_loop:
+        records, elapsed, peak = measure(loop_decode, data)
+        print(f"loop:       {elapsed:9.1f} ms, peak {peak:7.1f} MB, {len(records):,} records")
+
+
+if __name__ == "__main__":
+    main()
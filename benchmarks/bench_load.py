@@ -0,0 +1,251 @@
+"""
+Load test of the dashboard with many concurrent sessions against a local server.
+
+Starts `streamlit run rofacts.py` on a free port and, for every session count
+in --sessions, opens that many simulated browser sessions over Streamlit's
+websocket protocol. Each session clicks through the sidebar nav_* buttons.
+Reports p50/p95/p99 rerun latency (click sent -> script finished), reruns
+per second and the peak RSS of the server process, and writes the results as
+JSON next to the other benchmark results.
+
+Usage: python benchmarks/bench_load.py [--sessions 1 10 50 100 200 400] [--clicks N] [--url ws://host:port]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import requests
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(BASE_DIR, 'rofacts.py')
+RESULTS_DIR = os.path.join(BASE_DIR, 'benchmarks', 'results')
+
+# Sidebar buttons, see rofacts.py
+NAV_PAGES = ['Home', 'Economy', 'Peer countries', 'Government spending', 'Health', 'Population', 'About']
+
+STARTUP_TIMEOUT = 60
+RERUN_TIMEOUT = 120
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(port):
+    """Run the dashboard headless on a local port and wait until it is healthy"""
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP,
+         '--server.headless', 'true',
+         '--server.port', str(port),
+         '--server.address', '127.0.0.1',
+         '--server.enableCORS', 'false',
+         '--server.enableXsrfProtection', 'false',
+         '--server.fileWatcherType', 'none',
+         '--browser.gatherUsageStats', 'false'],
+        cwd=BASE_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {server.returncode}")
+        try:
+            if requests.get(f'http://127.0.0.1:{port}/_stcore/health', timeout=1).ok:
+                return server
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("streamlit did not become healthy in time")
+
+
+def rss_mb(pid):
+    """Resident set size of a process in MB, from /proc (Linux only)"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class Session:
+    """One simulated browser tab"""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.page_script_hash = ''
+        self.page_names = {}
+        # nav_* button key -> widget id, learned from the rendered sidebar
+        self.buttons = {}
+
+    @property
+    def page(self):
+        return self.page_names.get(self.page_script_hash)
+
+    def _rerun_msg(self, widget_id=None):
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = ''
+        state.page_script_hash = self.page_script_hash
+        if widget_id:
+            widget = state.widget_states.widgets.add()
+            widget.id = widget_id
+            widget.trigger_value = True
+        return msg.SerializeToString()
+
+    async def rerun(self, widget_id=None):
+        """Send a rerun (optionally clicking a button) and wait until the script finished"""
+        await self.websocket.send(self._rerun_msg(widget_id))
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await asyncio.wait_for(self.websocket.recv(), RERUN_TIMEOUT))
+            kind = msg.WhichOneof('type')
+            if kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+                element = msg.delta.new_element
+                if element.WhichOneof('type') == 'button' and element.button.id.endswith(
+                        tuple(f'nav_{page}' for page in NAV_PAGES)):
+                    self.buttons[element.button.id.rsplit('-', 1)[-1]] = element.button.id
+            elif kind == 'navigation':
+                self.page_script_hash = msg.navigation.page_script_hash
+                self.page_names = {page.page_script_hash: page.page_name for page in msg.navigation.app_pages}
+            elif kind == 'script_finished':
+                status = msg.script_finished
+                if status == ForwardMsg.FINISHED_SUCCESSFULLY:
+                    return
+                if status == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RuntimeError("script failed to compile")
+                # FINISHED_EARLY_FOR_RERUN: st.switch_page, the target page follows
+
+
+async def run_session(url, clicks, seed, latencies, errors):
+    rng = random.Random(seed)
+    try:
+        async with connect(f'{url}/_stcore/stream', subprotocols=['streamlit'], max_size=None) as websocket:
+            session = Session(websocket)
+            await session.rerun()
+            for _ in range(clicks):
+                page = rng.choice(NAV_PAGES)
+                widget_id = session.buttons.get(f'nav_{page}')
+                if widget_id is None:
+                    raise RuntimeError(f"nav_{page} button not rendered")
+                start = time.perf_counter()
+                await session.rerun(widget_id)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if session.page != page:
+                    raise RuntimeError(f"clicked nav_{page} but landed on {session.page}")
+    except Exception as e:
+        errors.append(f"{type(e).__name__}: {e}")
+
+
+async def run_step(url, sessions, clicks, pid):
+    """Run `sessions` concurrent sessions; returns the latency/throughput/RSS summary of the step"""
+    latencies, errors, rss = [], [], []
+
+    async def sample_rss():
+        while True:
+            value = rss_mb(pid) if pid else None
+            if value is not None:
+                rss.append(value)
+            await asyncio.sleep(0.2)
+
+    sampler = asyncio.create_task(sample_rss())
+    start, cpu_start = time.perf_counter(), time.process_time()
+    await asyncio.gather(*(run_session(url, clicks, seed, latencies, errors) for seed in range(sessions)))
+    elapsed = time.perf_counter() - start
+    # A load generator close to 100% CPU measures itself rather than the server
+    client_cpu = (time.process_time() - cpu_start) / elapsed
+    sampler.cancel()
+
+    def percentile(q):
+        if not latencies:
+            return None
+        return statistics.quantiles(latencies, n=100, method='inclusive')[q - 1] if len(latencies) > 1 else latencies[0]
+
+    return {
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'errors': len(errors),
+        'error_samples': sorted(set(errors))[:5],
+        'p50_ms': percentile(50),
+        'p95_ms': percentile(95),
+        'p99_ms': percentile(99),
+        'reruns_per_s': len(latencies) / elapsed if elapsed else None,
+        'wall_s': elapsed,
+        'peak_rss_mb': max(rss) if rss else None,
+        'client_cpu_pct': client_cpu * 100,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def _fmt(value, spec):
+    return '-' if value is None else format(value, spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 10, 50, 100, 200, 400],
+                        help="concurrent session counts, one step each")
+    parser.add_argument('--clicks', type=int, default=10, help="nav button clicks per session")
+    parser.add_argument('--url', help="load an already running server (ws://host:port) instead of starting one")
+    parser.add_argument('--output', help="results file (default: benchmarks/results/load-<commit>.json)")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url, pid = args.url.rstrip('/'), None
+    else:
+        port = free_port()
+        server = start_server(port)
+        url, pid = f'ws://127.0.0.1:{port}', server.pid
+
+    commit = _git_commit()
+    results = {'commit': commit, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'), 'clicks': args.clicks, 'steps': []}
+    try:
+        results['idle_rss_mb'] = rss_mb(pid) if pid else None
+        print(f"{'sessions':>9}{'reruns':>8}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'reruns/s':>10}{'RSS MB':>8}{'client CPU':>12}")
+        for sessions in args.sessions:
+            step = asyncio.run(run_step(url, sessions, args.clicks, pid))
+            results['steps'].append(step)
+            print(f"{sessions:>9}{step['reruns']:>8}{step['errors']:>8}{_fmt(step['p50_ms'], '9.1f')}"
+                  f"{_fmt(step['p95_ms'], '9.1f')}{_fmt(step['p99_ms'], '9.1f')}"
+                  f"{_fmt(step['reruns_per_s'], '10.1f')}{_fmt(step['peak_rss_mb'], '8.0f')}"
+                  f"{step['client_cpu_pct']:>11.0f}%")
+            for error in step['error_samples']:
+                print(f"          {error}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    output = args.output or os.path.join(RESULTS_DIR, f'load-{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {os.path.relpath(output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare reading the raw workbooks whole with pd.read_excel against streaming
+only the kept columns (rawdata.read_source) and against the compiled copy
+(rawdata.load), on today's workbooks and on a synthetic workbook with many
+unused columns.
+
+Usage: python benchmarks/bench_rawdata.py [--repeat N] [--rows N] [--columns N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rawdata  # noqa: E402
+
+
+def best_of(func, repeat):
+    """Best wall time of `repeat` calls, in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def peak_allocation(func):
+    """tracemalloc peak of one call, in MB"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def report(label, calls, repeat):
+    for method, func in calls.items():
+        print(f"{label:<16}{method:<12}{best_of(func, repeat):>12.2f}{peak_allocation(func):>12.2f}")
+
+
+def whole(spec, path):
+    """What the notebooks do: parse every cell of the sheet, then pick the columns"""
+    header = spec['header']
+    df = pd.read_excel(path, sheet_name=spec['sheet'], header=header)
+    return df[list(spec['columns'])] if header is not None else df.iloc[:, list(spec['columns'])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--rows', type=int, default=5000, help="rows of the synthetic workbook")
+    parser.add_argument('--columns', type=int, default=60, help="columns of the synthetic workbook, 2 of them kept")
+    args = parser.parse_args()
+
+    print(f"{'table':<16}{'method':<12}{'time (ms)':>12}{'peak (MB)':>12}")
+    for name, spec in rawdata.RAW_TABLES.items():
+        rawdata.compile_table(name)
+        path = rawdata.source_path(name)
+        report(name, {
+            'read_excel': lambda: whole(spec, path),
+            'streamed': lambda: rawdata.read_source(name),
+            'compiled': lambda: rawdata.load(name),
+        }, args.repeat)
+
+    # Wide workbook: the cost of read_excel follows the cells; read_table parses only the kept ones
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.random((args.rows, args.columns)), columns=[f'c{i}' for i in range(args.columns)])
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'wide.xlsx')
+        df.to_excel(path, index=False)
+        columns = {'c0': 'c0', 'c1': 'c1'}
+        report(f'{args.rows}x{args.columns}', {
+            'read_excel': lambda: pd.read_excel(path)[list(columns)],
+            'streamed': lambda: rawdata.read_table(path, columns, header=0),
+        }, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Run worldbank.refresh against a local stand-in for the World Bank API that
+replays the responses in benchmarks/worldbank/, with ETags like the real API.
+
+Checks what every feed would publish (nothing is written to Data/): the
+Romanian GDP of Data/gdp.csv, and the GDP per capita of every economy with
+the EU aggregate kept and the other aggregates left out, over several pages.
+Then times a cold refresh and a refresh revalidated from the response cache,
+where the server must answer every request with 304 Not Modified.
+
+The responses are in the format of the API's v2 JSON and hold the values of
+Data/gdp.csv and Data/gdp_per_capita.csv; the aggregates' values (EUU, WLD)
+are placeholders, so only the plumbing is checked. A response is stored as
+<path after /v2/ with '/' as '_'>.<page>.json.
+
+Usage: python benchmarks/bench_worldbank.py [--repeat N]
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import datastore  # noqa: E402
+import worldbank  # noqa: E402
+
+RECORDED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'worldbank')
+
+
+class RecordedHandler(BaseHTTPRequestHandler):
+    """Serves /v2/<path>?page=N from RECORDED_DIR and counts the status codes it answered with"""
+    statuses = []
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        page = parse_qs(url.query).get('page', ['1'])[0]
+        name = url.path.strip('/').removeprefix('v2/').replace('/', '_')
+        try:
+            with open(os.path.join(RECORDED_DIR, f'{name}.{page}.json'), 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            self.reply(404)
+            return
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.reply(304, headers={'ETag': etag})
+            return
+        self.reply(200, body, {'ETag': etag, 'Content-Type': 'application/json;charset=utf-8'})
+
+    def reply(self, status, body=b'', headers=None):
+        self.statuses.append(status)
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def check(frames):
+    """Raise if the published frames are not what the recorded responses hold"""
+    expected = pd.read_csv(os.path.join(datastore.DATA_DIR, 'gdp.csv'))
+    gdp = frames['gdp'].reset_index(drop=True)
+    if not gdp.equals(expected.astype(gdp.dtypes.to_dict())):
+        raise RuntimeError(f"gdp differs from Data/gdp.csv:\n{gdp.compare(expected)}")
+
+    peers = pd.read_csv(os.path.join(datastore.DATA_DIR, 'gdp_per_capita.csv'))
+    df = frames['gdp_per_capita']
+    if list(df.columns) != list(peers.columns):
+        raise RuntimeError(f"gdp_per_capita columns {list(df.columns)}, expected {list(peers.columns)}")
+    codes = set(df['country_code'])
+    if codes != set(peers['country_code']) | {'EUU'}:
+        raise RuntimeError(f"gdp_per_capita economies {sorted(codes)}: only the EUU aggregate must be kept")
+    economies = df[df['country_code'] != 'EUU'].sort_values(['country_code', 'year']).reset_index(drop=True)
+    expected = peers.sort_values(['country_code', 'year']).reset_index(drop=True)
+    if not economies.equals(expected.astype(economies.dtypes.to_dict())):
+        raise RuntimeError("gdp_per_capita values differ from Data/gdp_per_capita.csv")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RecordedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}/v2'
+
+    def published(name, df):
+        # What datastore.publish would write, without touching Data/
+        return df.reset_index(drop=True)
+
+    try:
+        cold, revalidated = [], []
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                client = worldbank.WorldBankClient(base_url, cache_dir)
+                RecordedHandler.statuses.clear()
+                start = time.perf_counter()
+                frames = worldbank.refresh(client=client, publish=published)
+                cold.append(time.perf_counter() - start)
+                check(frames)
+                if set(RecordedHandler.statuses) != {200}:
+                    raise RuntimeError(f"Cold refresh answered with {sorted(set(RecordedHandler.statuses))}")
+
+                RecordedHandler.statuses.clear()
+                start = time.perf_counter()
+                frames = worldbank.refresh(client=client, publish=published)
+                revalidated.append(time.perf_counter() - start)
+                check(frames)
+                if set(RecordedHandler.statuses) != {304}:
+                    raise RuntimeError(f"Revalidated refresh answered with {sorted(set(RecordedHandler.statuses))}")
+        requests = len(RecordedHandler.statuses)
+    finally:
+        server.shutdown()
+
+    print(f"{', '.join(f'{name}: {len(df)} rows' for name, df in frames.items())}; {requests} requests per refresh")
+    print(f"{'refresh':<14}{'time (ms)':>12}")
+    print(f"{'cold':<14}{min(cold) * 1000:>12.2f}")
+    print(f"{'revalidated':<14}{min(revalidated) * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
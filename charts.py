@@ -0,0 +1,503 @@
+"""
+Plotly figure builders for the RoFacts dashboard.
+
+The builders only take DataFrames and return figures, so they can also run
+outside Streamlit, e.g. from the offline build step in figures.py.
+"""
+import plotly.graph_objects as go
+
+import downsample
+
+# Most points a long monthly series sends to the browser, whatever the selected range
+MAX_CHART_POINTS = 300
+
+# GDP Chart Generator
+class RomaniaGDPAnalyzer:
+    def __init__(self):
+        self.color_background = '#F8EFDE'
+        self.color_gdp = '#46C07a'
+        self.color_arrow = '#FC8553'
+        
+    def create_gdp_plotly_chart(self, df):
+        """Create a Plotly line chart matching the wage graph style"""
+        fig = go.Figure()
+
+        # Add GDP line trace
+        fig.add_trace(go.Scatter(
+            x=df['year'], 
+            y=df['gdp_current_usd'] / 1e9,
+            mode='lines+markers',
+            name='GDP (Billions USD)',
+            line=dict(color=self.color_gdp),
+            hovertemplate='Year: %{x}<br>GDP: $%{y:.2f}B<extra></extra>'
+        ))
+
+        # Add vertical line for EU joining
+        fig.add_vline(
+            x=2007, 
+            line_dash="dash", 
+            line_color="#4f7d8f",
+            line_width=2
+        )
+
+        # Add annotation for EU joining
+        fig.add_annotation(
+            x=2007,
+            y=df['gdp_current_usd'].max() / 1e9 * 0.9,  # Position at 90% of max GDP height
+            text="Romania joins EU",
+            showarrow=False,  # Remove the arrow
+            font=dict(color="black", size=10),
+            xanchor='right',  # Right-align the text so it ends at the line
+            yanchor='middle'
+        )
+
+        fig.update_layout(
+            title='Romania GDP Evolution (1990-2025)',
+            title_x=0.35,  # Center the title
+            xaxis_title='Year',
+            yaxis_title='GDP (Billions USD)',
+            plot_bgcolor=self.color_background,
+            paper_bgcolor=self.color_background,
+            xaxis=dict(dtick=2),
+            yaxis=dict(tickformat='.'),
+            font=dict(family="Arial, sans-serif", size=12, color="black"),
+            title_font=dict(size=16, color="black")
+        )
+        return fig
+
+# Population Pyramid Functions
+def create_population_pyramid(df):
+    """
+    Creates a clean, simple population pyramid showing percentages
+    """
+    # Define colors to match your existing graphs
+    color_background = '#F8EFDE'
+    color_male = '#4f7d8f'  # Blue for men
+    color_female = '#c46e6e'  # Red for women
+    
+    # Extract data from DataFrame
+    age_groups = df['Age_group'].tolist()
+    male_population = df['Male_Count'].tolist()
+    female_population = df['Female_Count'].tolist()
+
+    # Convert percentages if they're stored as decimals in Excel
+    male_percentages = [p * 100 if p < 1 else p for p in df['Male_Percent'].tolist()]
+    female_percentages = [p * 100 if p < 1 else p for p in df['Female_Percent'].tolist()]
+    
+    fig = go.Figure()
+    
+    # Add male population (left side, negative values for display)
+    fig.add_trace(go.Bar(
+        y=age_groups,
+        x=[-p for p in male_percentages],  # Negative for left side
+        name='Male',
+        orientation='h',
+        marker=dict(color=color_male),
+        text=[f'{p:.1f}%' for p in male_percentages],
+        textposition='inside',
+        textfont=dict(color='white', size=10),
+        hovertemplate=(
+            '<b>%{y}</b><br>' +
+            'Male: %{customdata[0]:,.0f} people (%{customdata[1]:.1f}%)<br>' +
+            '<extra></extra>'
+        ),
+        customdata=list(zip(male_population, male_percentages)),
+        hoverlabel=dict(bgcolor=color_male, font=dict(color='white')),
+    ))
+    
+    # Add female population (right side)
+    fig.add_trace(go.Bar(
+        y=age_groups,
+        x=female_percentages,
+        name='Female',
+        orientation='h',
+        marker=dict(color=color_female),
+        text=[f'{p:.1f}%' for p in female_percentages],
+        textposition='inside',
+        textfont=dict(color='white', size=10),
+        hovertemplate=(
+            '<b>%{y}</b><br>' +
+            'Female: %{customdata[0]:,.0f} people (%{customdata[1]:.1f}%)<br>' +
+            '<extra></extra>'
+        ),
+        customdata=list(zip(female_population, female_percentages)),
+        hoverlabel=dict(bgcolor=color_female, font=dict(color='white')),
+    ))
+    
+    # Calculate tick range
+    max_percent = max(max(male_percentages), max(female_percentages))
+    tick_range = max_percent * 1.1
+    
+    # Create custom tick values and labels (absolute values)
+    tick_vals = []
+    tick_labels = []
+    
+    # Create ticks at even integer intervals (0, 2, 4, 6, etc.)
+    max_tick = int(max_percent) + 1
+    if max_tick % 2 != 0:  # Make sure we have even numbers
+        max_tick += 1
+    
+    for i in range(0, max_tick + 1, 2):  # Step by 2 to get even numbers
+        # Add negative tick (left side)
+        if i > 0:
+            tick_vals.append(-i)
+            tick_labels.append(f'{i}%')
+        # Add center tick (0)
+        if i == 0:
+            tick_vals.append(0)
+            tick_labels.append('0%')
+        # Add positive tick (right side)
+        if i > 0:
+            tick_vals.append(i)
+            tick_labels.append(f'{i}%')
+    
+    # Update layout
+    fig.update_layout(
+        title='Romania Population Pyramid 2023',
+        title_x=0.35,  # Center the title
+        xaxis=dict(
+            title='Population (%)',
+            range=[-tick_range, tick_range],
+            showgrid=True,
+            gridcolor='lightgray',
+            gridwidth=0.5,
+            zeroline=True,
+            zerolinecolor='black',
+            zerolinewidth=2,
+            tickfont=dict(color='black'),
+            tickvals=tick_vals,
+            ticktext=tick_labels
+        ),
+        yaxis=dict(
+            title='Age Groups',
+            categoryorder='array',
+            categoryarray=age_groups[::-1],  # Reverse order so youngest is at bottom
+            showgrid=True,
+            gridcolor='lightgray',
+            gridwidth=0.5,
+            tickfont=dict(color='black')
+        ),
+        barmode='relative',
+        bargap=0.1,
+        plot_bgcolor=color_background,
+        paper_bgcolor=color_background,
+        font=dict(family='Arial, sans-serif', size=12, color='black'),
+        legend=dict(
+            orientation='h',
+            yanchor='bottom',
+            y=1.02,
+            xanchor='center',
+            x=0.5,
+            bgcolor=color_background,
+            bordercolor="gray",
+            borderwidth=1
+        ),
+        height=500,
+        margin=dict(l=80, r=80, t=100, b=80)
+    )
+    
+    # Add gender labels
+    fig.add_annotation(
+        x=-tick_range*0.6,
+        y=len(age_groups),
+        text="Male",
+        showarrow=False,
+        font=dict(size=16, color=color_male, family='Arial Black'),
+        xanchor='center'
+    )
+    
+    fig.add_annotation(
+        x=tick_range*0.6,
+        y=len(age_groups),
+        text="Female",
+        showarrow=False,
+        font=dict(size=16, color=color_female, family='Arial Black'),
+        xanchor='center'
+    )
+    
+    return fig
+
+def create_population_pyramid_years(frames):
+    """
+    Population pyramid of several years, from year -> DataFrame as taken by
+    create_population_pyramid. Every year is an animation frame behind a year
+    slider, so changing the year happens in the browser without a rerun.
+    The axis fits the widest year, so it stays put while scrubbing.
+    """
+    years = sorted(frames)
+    figs = {year: create_population_pyramid(frames[year]) for year in years}
+    widest = max(figs.values(), key=lambda fig: fig.layout.xaxis.range[1])
+
+    title = 'Romania Population Pyramid {}'
+    fig = go.Figure(data=figs[years[-1]].data, layout=widest.layout)
+    fig.update_layout(title=title.format(years[-1]))
+    if len(years) == 1:
+        return fig
+
+    fig.frames = [
+        go.Frame(name=str(year), data=figs[year].data, layout=dict(title=dict(text=title.format(year))))
+        for year in years
+    ]
+    fig.update_layout(
+        sliders=[dict(
+            active=len(years) - 1,
+            currentvalue=dict(prefix='Year: '),
+            pad=dict(t=40),
+            steps=[dict(
+                label=str(year),
+                method='animate',
+                args=[[str(year)], dict(mode='immediate', frame=dict(duration=0, redraw=True), transition=dict(duration=0))],
+            ) for year in years],
+        )],
+        height=600,
+        margin=dict(b=140),
+    )
+    return fig
+
+# Life Expectancy Functions
+def create_life_expectancy_chart(df):
+    """Create life expectancy chart for Streamlit with toggle functionality"""
+    
+    # Define colors matching your reference
+    color_background = '#F8EFDE'
+    color_male = '#4f7d8f'  # Blue for males
+    color_female = '#c46e6e'  # Red for females
+    color_total = '#46C07a'  # Green for total (using your wage color)
+    
+    fig = go.Figure()
+    
+    # Prepare data
+    male_data = df[df['Sex'] == 'Males']
+    female_data = df[df['Sex'] == 'Females']
+    total_data = df[df['Sex'] == 'Total']
+    
+    # Add all traces (we'll control visibility with buttons)
+    if not male_data.empty:
+        fig.add_trace(go.Scatter(
+            x=male_data['Year'], 
+            y=male_data['Life_Expectancy'],
+            mode='lines+markers',
+            name='Males',
+            line=dict(color=color_male, width=3),
+            marker=dict(size=6),
+            visible=True
+        ))
+    
+    if not female_data.empty:
+        fig.add_trace(go.Scatter(
+            x=female_data['Year'], 
+            y=female_data['Life_Expectancy'],
+            mode='lines+markers',
+            name='Females',
+            line=dict(color=color_female, width=3),
+            marker=dict(size=6),
+            visible=True
+        ))
+    
+    if not total_data.empty:
+        fig.add_trace(go.Scatter(
+            x=total_data['Year'], 
+            y=total_data['Life_Expectancy'],
+            mode='lines+markers',
+            name='Total',
+            line=dict(color=color_total, width=3),
+            marker=dict(size=6),
+            visible=False
+        ))
+    
+    # Update layout with your styling and buttons
+    fig.update_layout(
+        title='Romania Life Expectancy (1990-2023)',
+        title_x=0.35,  # Center the title
+        xaxis_title='Year',
+        yaxis_title='Life Expectancy (Years)',
+        plot_bgcolor=color_background,
+        paper_bgcolor=color_background,
+        xaxis=dict(
+            dtick=2  # Show every 2 years
+        ),
+        yaxis=dict(
+            tickformat='.1f'  # One decimal place
+        ),
+        legend=dict(
+            x=0.02,
+            y=0.98,
+            bgcolor='rgba(255,255,255,0.8)',
+            bordercolor='rgba(0,0,0,0.2)',
+            borderwidth=1
+        ),
+        hovermode='x unified',
+        height=500,  # Match other charts
+        font=dict(family="Arial, sans-serif", size=12, color="black"),
+        title_font=dict(size=16, color="black"),
+        updatemenus=[
+            dict(
+                type="buttons",
+                direction="left",
+                buttons=list([
+                    dict(
+                        args=[{"visible": [True, True, False]}],
+                        label="By Gender",
+                        method="restyle"
+                    ),
+                    dict(
+                        args=[{"visible": [False, False, True]}],
+                        label="Total Only",
+                        method="restyle"
+                    )
+                ]),
+                pad={"r": 10, "t": 10},
+                showactive=True,
+                x=0.5,
+                xanchor="center",
+                y=1.08,  # Lowered from 1.15 to accommodate centered title
+                yanchor="middle",
+                bgcolor='rgba(255,255,255,0.8)',
+                bordercolor='rgba(0,0,0,0.2)',
+                borderwidth=1,
+                font=dict(size=12)
+            ),
+        ]
+    )
+    
+    return fig
+
+# Real Wage Functions
+def create_wage_chart(merged_df, base_year=2023):
+    """
+    Create the real average wage chart with the 2005 recovery annotation.
+    Reads the 'Real Average Wage (RON) - <base_year> prices' column.
+    """
+    value_column = f'Real Average Wage (RON) - {base_year} prices'
+    color_background = '#F8EFDE'
+    color_wage = '#46C07a'
+    color_arrow = '#FC8553'
+
+    fig_wage = go.Figure()
+    fig_wage.add_trace(go.Scatter(
+        x=merged_df['Year'], 
+        y=merged_df[value_column],
+        mode='lines+markers',
+        name='Real Wage',
+        line=dict(color=color_wage)
+    ))
+
+    if 2005 in merged_df['Year'].values:
+        wage_2005 = merged_df.loc[merged_df['Year'] == 2005, value_column].iloc[0]
+        fig_wage.add_annotation(
+            x=2005, 
+            y=wage_2005,
+            text="The average real wage reached the 1991 level", 
+            showarrow=True,
+            font=dict(color="black", size=10),
+            arrowhead=2, 
+            arrowsize=1, 
+            arrowwidth=2, 
+            arrowcolor='#4f7d8f',  # Changed to male color (blue)
+            ax=-100, 
+            ay=-100
+        )
+
+    fig_wage.update_layout(
+        title='Real Average Wage (1991-2023)',
+        title_x=0.35,  # Center the title
+        xaxis_title='Year',
+        yaxis_title=f'Amount (RON, {base_year} prices)',
+        plot_bgcolor=color_background,
+        paper_bgcolor=color_background,
+        xaxis=dict(dtick=4),
+        yaxis=dict(tickformat='.'),
+        height=500
+    )
+
+    return fig_wage
+
+
+def create_monthly_wage_chart(monthly_df, start_year=None, end_year=None, max_points=MAX_CHART_POINTS):
+    """
+    Create the monthly real wage chart for the selected years as a WebGL line.
+    The visible months are decimated with LTTB to at most max_points points,
+    so a narrow range shows every month and the payload stays bounded for any history length.
+    """
+    color_background = '#F8EFDE'
+    color_wage = '#46C07a'
+    value_column = 'Real Average Wage (RON) - 2023 prices'
+
+    years = monthly_df['Month'].dt.year
+    start_year = start_year or int(years.min())
+    end_year = end_year or int(years.max())
+    visible = monthly_df[(years >= start_year) & (years <= end_year)]
+    visible = visible.iloc[downsample.lttb(visible['Month'].to_numpy(), visible[value_column].to_numpy(), max_points)]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=visible['Month'],
+        y=visible[value_column],
+        mode='lines',
+        name='Real Wage',
+        line=dict(color=color_wage),
+        hovertemplate='%{x|%b %Y}: %{y:,.0f} RON<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title=f'Monthly Real Average Wage ({start_year}-{end_year})',
+        title_x=0.35,  # Center the title
+        xaxis_title='Month',
+        yaxis_title='Amount (RON, 2023 prices)',
+        plot_bgcolor=color_background,
+        paper_bgcolor=color_background,
+        yaxis=dict(tickformat='.'),
+        height=500
+    )
+
+    return fig
+
+
+def create_peer_chart(series_df, axis_title, home=None, reverse=False, reference=None):
+    """
+    Create the peer comparison line chart: one line per column of series_df (years x countries),
+    the `home` country drawn thicker on top. `reverse` flips the y axis (ranks);
+    `reference` draws a dashed line at that value (the EU average on the EU = 100 scale).
+    """
+    color_background = '#F8EFDE'
+    color_home = '#4f7d8f'
+    color_peers = ['#46C07a', '#FC8553', '#B8860B', '#8E6C8A', '#C0504D', '#7A8B99', '#5B9BD5', '#A5A5A5']
+
+    fig = go.Figure()
+    peers = [country for country in series_df.columns if country != home]
+    for i, country in enumerate(peers):
+        fig.add_trace(go.Scatter(
+            x=series_df.index,
+            y=series_df[country],
+            mode='lines',
+            name=country,
+            line=dict(color=color_peers[i % len(color_peers)], width=1.5),
+            hovertemplate=f'{country}<br>%{{x}}: %{{y:,.1f}}<extra></extra>'
+        ))
+    if home in series_df.columns:
+        fig.add_trace(go.Scatter(
+            x=series_df.index,
+            y=series_df[home],
+            mode='lines+markers',
+            name=home,
+            line=dict(color=color_home, width=3),
+            hovertemplate=f'{home}<br>%{{x}}: %{{y:,.1f}}<extra></extra>'
+        ))
+
+    if reference is not None:
+        fig.add_hline(y=reference, line_dash='dash', line_color='black', line_width=1,
+                      annotation_text='EU average', annotation_position='top left')
+
+    fig.update_layout(
+        title=f'{axis_title} ({series_df.index.min()}-{series_df.index.max()})',
+        title_x=0.35,  # Center the title
+        xaxis_title='Year',
+        yaxis_title=axis_title,
+        plot_bgcolor=color_background,
+        paper_bgcolor=color_background,
+        xaxis=dict(dtick=4),
+        yaxis=dict(tickformat=',', autorange='reversed' if reverse else True),
+        height=550
+    )
+
+    return fig
@@ -0,0 +1,83 @@
+"""
+Vectorized consumer price index engine.
+
+Builds cumulative price indices from annual or monthly inflation rates and
+reprices nominal series to any base period with a single array operation.
+This replaces the row-by-row CPI loops in Code/real_wage.ipynb.
+"""
+import numpy as np
+
+
+class PriceIndex:
+    """Cumulative price index over consecutive periods (years, or months as datetime64[M])"""
+
+    def __init__(self, periods, levels):
+        self.periods = np.asarray(periods)
+        self.levels = np.asarray(levels, dtype='float64')
+        if len(self.periods) != len(self.levels):
+            raise ValueError("periods and levels must have the same length")
+
+    @classmethod
+    def from_rates(cls, periods, rates, percent=False):
+        """
+        Chain period-on-period inflation rates into an index equal to 1 in the first period.
+        The first rate is ignored, as it describes the move into the first period.
+        """
+        rates = np.asarray(rates, dtype='float64')
+        if percent:
+            rates = rates / 100
+        growth = 1 + rates
+        growth[0] = 1
+        return cls(periods, np.cumprod(growth))
+
+    @classmethod
+    def monthly_from_annual_rates(cls, years, rates, percent=False):
+        """
+        Monthly index from annual average inflation of consecutive years.
+        An annual average rate measures the move between the middles of two years,
+        so the rate of year Y is spread evenly (geometrically) from July Y-1 to June Y;
+        the second half of the last year reuses its own rate. The yearly means of the
+        monthly index then follow the annual index.
+        """
+        years = np.asarray(years, dtype='int64')
+        rates = np.asarray(rates, dtype='float64')
+        if percent:
+            rates = rates / 100
+        monthly = (1 + rates) ** (1 / 12) - 1
+        next_monthly = np.append(monthly[1:], monthly[-1])
+        monthly_rates = np.column_stack([
+            np.repeat(monthly[:, None], 6, axis=1),
+            np.repeat(next_monthly[:, None], 6, axis=1),
+        ]).ravel()
+        months = np.arange(f'{years[0]}-01', f'{years[-1] + 1}-01', dtype='datetime64[M]')
+        return cls.from_rates(months, monthly_rates)
+
+    @property
+    def is_monthly(self):
+        return self.periods.dtype.kind == 'M'
+
+    def base_level(self, base):
+        """
+        Index level of the base period.
+        For a monthly index a base year averages the levels of its months.
+        """
+        if self.is_monthly and isinstance(base, (int, np.integer)):
+            years = self.periods.astype('datetime64[Y]').astype('int64') + 1970
+            in_year = years == base
+            if not in_year.any():
+                raise KeyError(f"Base year {base} is outside the index")
+            return self.levels[in_year].mean()
+
+        base = np.asarray(base, dtype=self.periods.dtype)
+        position = np.searchsorted(self.periods, base)
+        if position >= len(self.periods) or self.periods[position] != base:
+            raise KeyError(f"Base period {base} is outside the index")
+        return self.levels[position]
+
+    def rebase(self, base):
+        """Index levels expressed relative to the base period (base = 1)"""
+        return self.levels / self.base_level(base)
+
+    def reprice(self, nominal, base):
+        """Convert a nominal series aligned with the periods to base-period prices"""
+        return np.asarray(nominal, dtype='float64') * (self.base_level(base) / self.levels)
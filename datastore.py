@@ -0,0 +1,273 @@
+"""
+Compiled columnar store for the datasets under Data/.
+
+Every dataset is compiled once into an uncompressed Arrow IPC file under
+Data/compiled/ with typed columns. The loaders memory-map that file and only
+fall back to parsing the original spreadsheet or CSV when the compiled copy
+is missing or was built from an older version of the source.
+
+Run `python datastore.py` to (re)build every compiled file.
+"""
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+import pyarrow as pa
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, 'Data')
+COMPILED_DIR = os.path.join(DATA_DIR, 'compiled')
+
+# Schema metadata key holding the version (see compiled_version) the file was built from
+SOURCE_KEY = b'rofacts.source'
+
+# Source file, column types and optional row filter / sort order of every dataset used by the dashboard
+DATASETS = {
+    'gdp': {
+        'source': 'gdp.csv',
+        'dtypes': {'year': 'int16', 'gdp_current_usd': 'float64'},
+        'query': '1990 <= year <= 2025',
+        'sort_by': 'year',
+    },
+    'real_wage': {
+        'source': 'real_wage.csv',
+        'dtypes': {
+            'Year': 'int16',
+            'Average wage (RON)': 'float64',
+            'Inflation': 'float64',
+            'CPI-1991': 'float64',
+            'CPI-2023': 'float64',
+            'Real Average Wage (RON) - 2023 prices': 'int64',
+        },
+    },
+    'monthly_wage': {
+        'source': 'monthly_wage.csv',
+        'dtypes': {
+            'Month': 'datetime64[ns]',
+            'Average wage (RON)': 'float64',
+            'CPI': 'float64',
+            'Real Average Wage (RON) - 2023 prices': 'float64',
+        },
+    },
+    'life_expectancy': {
+        'source': 'life_expectancy.xlsx',
+        'dtypes': {'Year': 'int16', 'Sex': 'category', 'Life_Expectancy': 'float64'},
+    },
+    'gdp_per_capita': {
+        'source': 'gdp_per_capita.csv',
+        'dtypes': {'country': 'str', 'country_code': 'str', 'year': 'int16', 'gdp_per_capita_ppp': 'float64'},
+        'sort_by': ['country_code', 'year'],
+    },
+    'population': {
+        'source': 'population.xlsx',
+        'dtypes': {
+            'Age_group': 'str',
+            'Male_Count': 'int64',
+            'Female_Count': 'int64',
+            'Total_count': 'int64',
+            'Male_Percent': 'float64',
+            'Female_Percent': 'float64',
+        },
+    },
+}
+
+
+def source_path(name):
+    """Path of the original spreadsheet or CSV behind a dataset"""
+    return os.path.join(DATA_DIR, DATASETS[name]['source'])
+
+
+def compiled_path(name):
+    """Path of the compiled Arrow IPC file for a dataset"""
+    return os.path.join(COMPILED_DIR, f'{name}.arrow')
+
+
+# path -> (mtime_ns, size, content hash) of the last time the file was hashed
+_content_hashes = {}
+
+
+def file_fingerprint(path):
+    """
+    Version of a file: its size and a hash of its content.
+    The content is only re-hashed when the mtime or size changed, so a file
+    touched without being modified keeps its version.
+    """
+    stat = os.stat(path)
+    cached = _content_hashes.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        digest = cached[2]
+    else:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:16]
+        _content_hashes[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return f'{stat.st_size}-{digest}'
+
+
+def source_fingerprint(name):
+    """Version of the source file behind a dataset"""
+    return file_fingerprint(source_path(name))
+
+
+def compiled_version(name):
+    """
+    Version a compiled file is valid for: the source fingerprint and a hash of the
+    dataset's spec, so a change to its column types or filter rebuilds it too
+    """
+    spec = json.dumps(DATASETS[name], sort_keys=True).encode()
+    return f'{source_fingerprint(name)}-{hashlib.sha1(spec).hexdigest()[:8]}'
+
+
+def read_source(name):
+    """Parse the original spreadsheet or CSV and apply the dataset's column types"""
+    spec = DATASETS[name]
+    path = source_path(name)
+    if path.endswith('.csv'):
+        df = pd.read_csv(path)
+    else:
+        df = pd.read_excel(path)
+    df = df.astype(spec['dtypes'])
+
+    if 'query' in spec:
+        df = df.query(spec['query'])
+    if 'sort_by' in spec:
+        df = df.sort_values(spec['sort_by'])
+    return df.reset_index(drop=True)
+
+
+def write_arrow(path, df, version):
+    """Write a frame to an Arrow IPC file, with the version it was built from in its schema metadata"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[SOURCE_KEY] = version.encode()
+    table = table.replace_schema_metadata(metadata)
+
+    # Write next to the target and rename, so readers never see a half-written file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def read_arrow(path, version):
+    """
+    Memory-map an Arrow IPC file written by write_arrow.
+    Numeric columns are zero-copy, read-only views of the mapped file.
+    Returns None when the file is missing or was built from a different version.
+    """
+    if not os.path.exists(path):
+        return None
+
+    reader = pa.ipc.open_file(pa.memory_map(path, 'r'))
+    built_from = (reader.schema.metadata or {}).get(SOURCE_KEY, b'').decode()
+    if built_from != version:
+        return None
+    # One block per column keeps pandas from consolidating (copying) the mapped columns
+    return reader.read_all().to_pandas(split_blocks=True)
+
+
+def write_compiled(name, df, version):
+    """Write a parsed frame to the compiled Arrow IPC file of a dataset"""
+    write_arrow(compiled_path(name), df, version)
+
+
+def compile_dataset(name):
+    """Parse the source of one dataset, compile it and return the frame"""
+    version = compiled_version(name)
+    df = read_source(name)
+    write_compiled(name, df, version)
+    return df
+
+
+def _read_file(path):
+    return pd.read_csv(path) if path.endswith('.csv') else pd.read_excel(path)
+
+
+def write_source(name, df):
+    """
+    Replace the source file of a dataset with a frame, atomically. A file whose
+    content would not change is left as it is, so rebuilding a tracked file
+    from the same data does not touch it (an .xlsx differs in every write).
+    """
+    path = source_path(name)
+    root, extension = os.path.splitext(path)
+    # Keep the extension on the temporary file so pandas picks the right writer
+    tmp_path = f'{root}.{os.getpid()}.tmp{extension}'
+    if extension == '.csv':
+        # 15 significant digits drop the representation noise of float arithmetic (59.099999999999994)
+        df.to_csv(tmp_path, index=False, float_format='%.15g')
+    else:
+        df.to_excel(tmp_path, index=False)
+
+    if os.path.exists(path) and _read_file(tmp_path).equals(_read_file(path)):
+        os.remove(tmp_path)
+        return
+    os.replace(tmp_path, path)
+
+
+def publish(name, df):
+    """
+    Replace the source file of a dataset with a freshly fetched frame and compile it
+    right away, so the loaders switch to the new data on their next call.
+    """
+    write_source(name, df)
+    return compile_dataset(name)
+
+
+def read_compiled(name):
+    """
+    Memory-map the compiled file for a dataset (see read_arrow).
+    Returns None when the file is missing or was built from a different version.
+    """
+    return read_arrow(compiled_path(name), compiled_version(name))
+
+
+class SharedFrame:
+    """
+    A dataset held once and shared by every caller, e.g. every session of the server.
+    The frame itself is never handed out: view() returns a shallow copy that shares
+    all columns, and pandas copy-on-write (the default from pandas 3, hence the pin
+    in requirements.txt) copies a column only when a caller writes to it, so the
+    shared data cannot be changed by accident.
+    """
+
+    def __init__(self, df):
+        self._frame = df
+
+    def __len__(self):
+        return len(self._frame)
+
+    def view(self):
+        """Read-only-by-default view of the dataset; costs no copy of the data"""
+        return self._frame.copy(deep=False)
+
+
+def load(name):
+    """Load a dataset from the compiled store, rebuilding it from the source when stale"""
+    df = read_compiled(name)
+    if df is not None:
+        return df
+
+    version = compiled_version(name)
+    df = read_source(name)
+    try:
+        write_compiled(name, df, version)
+    except OSError:
+        # Read-only checkout: keep serving straight from the source file
+        pass
+    return df
+
+
+def main():
+    for name in DATASETS:
+        start = time.perf_counter()
+        df = compile_dataset(name)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{name}: {len(df)} rows -> {os.path.relpath(compiled_path(name), BASE_DIR)} ({elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
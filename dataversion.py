@@ -0,0 +1,72 @@
+"""
+Data versions of the datasets under Data/, kept current while the server runs.
+
+A background thread polls the source files every few seconds and updates a
+name -> fingerprint dict when a file changes (see datastore.file_fingerprint
+for how a fingerprint is made). Every cache key in the dashboard includes the
+version of the data it was built from, so rewritten files are picked up
+without restarting the server, while the hot path stays one dict lookup.
+"""
+import logging
+import threading
+import time
+
+import datastore
+
+# Seconds between two polls of Data/
+POLL_INTERVAL = 2.0
+
+logger = logging.getLogger(__name__)
+
+# dataset name -> fingerprint of its source file
+_versions = {}
+_lock = threading.Lock()
+_watcher = None
+
+
+def refresh():
+    """Re-fingerprint every source file; returns the names of the datasets that changed"""
+    changed = []
+    for name in datastore.DATASETS:
+        try:
+            fingerprint = datastore.source_fingerprint(name)
+        except OSError:
+            # File is being replaced right now; keep serving the previous version
+            continue
+        if _versions.get(name) != fingerprint:
+            _versions[name] = fingerprint
+            changed.append(name)
+    return changed
+
+
+def _watch(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            changed = refresh()
+        except Exception:
+            logger.exception("Polling Data/ failed")
+            continue
+        if changed:
+            logger.info("New data version for %s", ', '.join(changed))
+
+
+def start(interval=POLL_INTERVAL):
+    """Fingerprint every dataset and start the watcher thread, once per process"""
+    global _watcher
+    with _lock:
+        if _watcher is not None:
+            return
+        refresh()
+        _watcher = threading.Thread(target=_watch, args=(interval,), name='rofacts-data-watcher', daemon=True)
+        _watcher.start()
+
+
+def version(name):
+    """Current version of a dataset"""
+    try:
+        return _versions[name]
+    except KeyError:
+        # Outside the dashboard (build scripts, benchmarks) nothing is watching
+        _versions[name] = datastore.source_fingerprint(name)
+        return _versions[name]
@@ -0,0 +1,67 @@
+"""
+Eurostat life expectancy download (dataset demo_mlexpec).
+
+Replaces the per-key decoding loop of Code/life_expectancy.ipynb with the
+vectorized JSON-stat decoder, so the same code handles one country at birth
+or every age, sex, year and EU country in one response.
+
+Run `python eurostat.py` to refresh Data/life_expectancy.xlsx.
+"""
+import time
+
+import pandas as pd
+import requests
+
+import datastore
+import jsonstat
+
+URL = "https://ec.europa.eu/eurostat/api/dissemination/statistics/1.0/data/demo_mlexpec"
+
+
+def life_expectancy_frame(data):
+    """
+    Tidy Year / Sex / Life_Expectancy frame from a demo_mlexpec response.
+    Country and Age columns are added when the response covers more than one.
+    """
+    df = jsonstat.decode(data)
+
+    out = pd.DataFrame({
+        'Year': df['time'].astype(int),
+        'Sex': df['sex'].astype(str),
+        'Life_Expectancy': df['value'],
+    })
+    sort_by = ['Year', 'Sex']
+    for dim, column in (('geo', 'Country'), ('age', 'Age')):
+        if dim in df and df[dim].nunique() > 1:
+            out.insert(0, column, df[dim].astype(str))
+            sort_by.insert(0, column)
+    return out.sort_values(sort_by).reset_index(drop=True)
+
+
+def get_life_expectancy(geo='RO', age='Y_LT1', session=None):
+    """Life expectancy for one or more countries (geo) and ages (age), e.g. age='Y_LT1' for at birth"""
+    params = {
+        'format': 'JSON',
+        'geo': geo,
+        'age': age,
+        'lang': 'en',
+    }
+    response = (session or requests).get(URL, params=params, timeout=60)
+    response.raise_for_status()
+    return life_expectancy_frame(response.json())
+
+
+def write_life_expectancy():
+    """Download life expectancy at birth in Romania into the source file of the life_expectancy dataset"""
+    datastore.write_source('life_expectancy', get_life_expectancy())
+
+
+def main():
+    start = time.perf_counter()
+    df = datastore.publish('life_expectancy', get_life_expectancy())
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"life_expectancy: {len(df)} rows, {df['Year'].min()}-{df['Year'].max()} ({elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
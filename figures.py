@@ -0,0 +1,156 @@
+"""
+Offline compilation of the dashboard figures into ready-to-serve Plotly JSON.
+
+Every chart only depends on the files under Data/ and on the builder code in
+charts.py, so it is built once and written to
+Data/compiled/figures/<chart>.<version>.json, where the version hashes both.
+The dashboard loads those artifacts instead of running pandas and Plotly on
+every rerun, and builds a missing artifact on first use. A loaded figure is a
+SharedFigure: the artifact's JSON is kept as is and sent to the browser
+without being converted or encoded again.
+
+Run `python figures.py` to (re)build every figure.
+"""
+import hashlib
+import json
+import os
+import time
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import charts
+import datastore
+import dataversion
+import downsample
+
+FIGURE_DIR = os.path.join(datastore.COMPILED_DIR, 'figures')
+
+# Chart name -> (datasets it is built from, builder taking those frames in order)
+FIGURES = {
+    'wage': (('real_wage',), charts.create_wage_chart),
+    'monthly_wage': (('monthly_wage',), charts.create_monthly_wage_chart),
+    'gdp': (('gdp',), charts.RomaniaGDPAnalyzer().create_gdp_plotly_chart),
+    'population_pyramid': (('population',), charts.create_population_pyramid),
+    'life_expectancy': (('life_expectancy',), charts.create_life_expectancy_chart),
+}
+
+
+class SharedFigure:
+    """
+    A figure built once and shared by every session, kept as its plain dict and
+    its serialized JSON spec (see ui.plotly_chart, which renders the spec as is).
+    The dict must not be modified; with_layout() gives a variant instead.
+    """
+
+    def __init__(self, spec, figure_dict=None):
+        self.spec = spec
+        self.figure_dict = json.loads(spec) if figure_dict is None else figure_dict
+        self._variants = {}
+
+    @classmethod
+    def from_figure(cls, fig):
+        figure_dict = fig.to_dict()
+        return cls(pio.to_json(figure_dict, validate=False), figure_dict)
+
+    @property
+    def layout(self):
+        return self.figure_dict.get('layout', {})
+
+    def with_layout(self, **changes):
+        """
+        Variant with top-level layout properties replaced, e.g. with_layout(height=500).
+        Only the layout is copied; the traces are shared, and every variant is
+        built and encoded once.
+        """
+        key = json.dumps(changes, sort_keys=True)
+        variant = self._variants.get(key)
+        if variant is None:
+            figure_dict = {**self.figure_dict, 'layout': {**self.layout, **changes}}
+            variant = SharedFigure(pio.to_json(figure_dict, validate=False), figure_dict)
+            self._variants[key] = variant
+        return variant
+
+    def to_figure(self):
+        """Editable go.Figure copy (slow: Plotly validates every property)"""
+        return go.Figure(self.figure_dict)
+
+
+def _code_version():
+    digest = hashlib.sha1()
+    for module in (charts, downsample):
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Changes to the builders (and the decimation they use) must invalidate the artifacts just like changes to the data
+CODE_VERSION = _code_version()
+
+
+def figure_version(name):
+    """Version of a chart: a hash of the builder code and of its source data fingerprints"""
+    datasets, _ = FIGURES[name]
+    digest = hashlib.sha1(CODE_VERSION.encode())
+    for dataset in datasets:
+        digest.update(dataversion.version(dataset).encode())
+    return digest.hexdigest()[:16]
+
+
+def figure_path(name, version):
+    return os.path.join(FIGURE_DIR, f'{name}.{version}.json')
+
+
+def build_figure(name, load=datastore.load):
+    """Run the chart builder on data loaded with `load` (dataset name -> frame)"""
+    datasets, builder = FIGURES[name]
+    return builder(*[load(dataset) for dataset in datasets])
+
+
+def compile_figure(name, version=None, load=datastore.load):
+    """Build one chart, write its JSON artifact and drop artifacts of older versions"""
+    version = version or figure_version(name)
+    fig = build_figure(name, load)
+
+    os.makedirs(FIGURE_DIR, exist_ok=True)
+    path = figure_path(name, version)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(pio.to_json(fig, validate=False))
+    os.replace(tmp_path, path)
+
+    for file_name in os.listdir(FIGURE_DIR):
+        if file_name.startswith(f'{name}.') and file_name.endswith('.json') and file_name != os.path.basename(path):
+            os.remove(os.path.join(FIGURE_DIR, file_name))
+    return fig
+
+
+def load_figure(name, version=None, load=datastore.load):
+    """
+    Load the compiled figure for the current data as a SharedFigure,
+    compiling it first (from data loaded with `load`) if it is missing
+    """
+    version = version or figure_version(name)
+    path = figure_path(name, version)
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return SharedFigure(f.read())
+
+    try:
+        return SharedFigure.from_figure(compile_figure(name, version, load))
+    except OSError:
+        # Read-only checkout: build in memory only
+        return SharedFigure.from_figure(build_figure(name, load))
+
+
+def main():
+    for name in FIGURES:
+        start = time.perf_counter()
+        version = figure_version(name)
+        compile_figure(name, version)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{name}: {os.path.relpath(figure_path(name, version), datastore.BASE_DIR)} ({elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Render timing of the dashboard pages.
+
+Every rerun is traced as a list of timed spans, one per stage of a page:
+loading data, pandas filtering, building or fetching figures and rendering
+them with st.plotly_chart. Spans around cached functions are hits unless a
+cached body runs inside them and calls cache_miss(), or 'disk' when the
+result was read back from the persistent cache (see persist.py).
+
+Add ?debug=1 to the URL to show the spans of every rerun in the sidebar
+(?debug=0 hides them again). A fragment rerun on its own (see fragment())
+is traced as a rerun of its own, shown above the fragment.
+
+Reruns slower than SLOW_RERUN_MS are appended to SLOW_RERUN_LOG as one JSON
+object per line. Both can be set with the ROFACTS_SLOW_RERUN_MS and
+ROFACTS_SLOW_RERUN_LOG environment variables.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SLOW_RERUN_MS = float(os.environ.get('ROFACTS_SLOW_RERUN_MS', 1000))
+SLOW_RERUN_LOG = os.environ.get('ROFACTS_SLOW_RERUN_LOG', os.path.join(BASE_DIR, 'logs', 'slow_reruns.jsonl'))
+
+# Query parameter that turns the sidebar debug panel on or off for a session
+DEBUG_PARAM = 'debug'
+
+logger = logging.getLogger(__name__)
+
+# Streamlit runs the script of every session in its own thread, so the trace of
+# the running rerun is thread-local; outside a rerun (build scripts, benchmarks) spans do nothing
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+class Trace:
+    """Spans of one rerun, in the order they started"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.start = time.perf_counter()
+        self.spans = []
+        self.open = []
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+
+def start_rerun():
+    """Start tracing the rerun running in this thread"""
+    _local.trace = Trace()
+    return _local.trace
+
+
+@contextmanager
+def span(name, stage, cached=False):
+    """Time a block as one stage of the current rerun"""
+    trace = getattr(_local, 'trace', None)
+    if trace is None:
+        yield
+        return
+
+    record = {'stage': stage, 'name': name, 'depth': len(trace.open)}
+    if cached:
+        record['cache'] = 'hit'
+    trace.spans.append(record)
+    trace.open.append(record)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record['ms'] = round((time.perf_counter() - start) * 1000, 3)
+        trace.open.pop()
+
+
+def timed(stage, cached=False):
+    """Decorator timing every call of a function as a span named after the call"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            name = f"{func.__name__}({', '.join(map(str, args))})"
+            with span(name, stage, cached):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def cache_miss(status='miss'):
+    """
+    Called from the body of a cached function: flag every open cached span as a miss,
+    or as 'disk' if it was served from the persistent cache (a miss stays a miss)
+    """
+    trace = getattr(_local, 'trace', None)
+    if trace is None:
+        return
+    for record in trace.open:
+        if record.get('cache') == 'hit' or (status == 'miss' and 'cache' in record):
+            record['cache'] = status
+
+
+def debug_enabled():
+    """Whether this session asked for the debug panel; remembered across page switches"""
+    value = st.query_params.get(DEBUG_PARAM)
+    if value is not None:
+        st.session_state.debug_timing = value.lower() not in ('0', 'false', 'off')
+    return st.session_state.get('debug_timing', False)
+
+
+def log_slow_rerun(record):
+    """Append a slow rerun to the JSON lines log"""
+    try:
+        os.makedirs(os.path.dirname(SLOW_RERUN_LOG), exist_ok=True)
+        line = json.dumps(record)
+        with _log_lock, open(SLOW_RERUN_LOG, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+    except OSError:
+        logger.warning("Could not write the slow rerun log %s", SLOW_RERUN_LOG, exc_info=True)
+
+
+def debug_panel(trace, total_ms, container=None):
+    """Spans of the current rerun, in the sidebar unless another container is given"""
+    container = container or st.sidebar
+    with container.expander("Render timing", expanded=True):
+        st.caption(f"Rerun: {total_ms:.1f} ms (slow above {SLOW_RERUN_MS:.0f} ms)")
+        if not trace.spans:
+            return
+        df = pd.DataFrame(trace.spans)
+        df['name'] = [' ' * depth + name for depth, name in zip(df['depth'], df['name'])]
+        columns = ['stage', 'name', 'ms'] + (['cache'] if 'cache' in df else [])
+        st.dataframe(df[columns], hide_index=True, width='stretch')
+
+
+def finish_rerun(page, container=None):
+    """End the trace of this rerun: show the debug panel if asked for and log the rerun if slow"""
+    trace = getattr(_local, 'trace', None)
+    if trace is None:
+        return
+    _local.trace = None
+    total_ms = trace.elapsed_ms()
+
+    if total_ms > SLOW_RERUN_MS:
+        log_slow_rerun({
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(trace.started)),
+            'page': page,
+            'total_ms': round(total_ms, 3),
+            'spans': trace.spans,
+        })
+    if debug_enabled():
+        debug_panel(trace, total_ms, container)
+
+
+def fragment(func):
+    """
+    st.fragment whose reruns on their own are traced like a rerun of the page.
+    Those reruns do not run rofacts.py. What a fragment writes to the sidebar is
+    not cleared by its next rerun and would pile up, so the debug panel of such
+    a rerun is shown in a container at the top of the fragment instead.
+    """
+    @st.fragment
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # Created on full reruns too, so the fragment's elements keep their place
+        panel = st.container()
+        ctx = get_script_run_ctx()
+        if not (ctx and ctx.fragment_ids_this_run):
+            # Part of a full rerun, already traced
+            return func(*args, **kwargs)
+        start_rerun()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            finish_rerun(f"{st.session_state.get('current_page')} / {func.__name__}", panel)
+    return wrapper
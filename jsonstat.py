@@ -0,0 +1,79 @@
+"""
+Vectorized JSON-stat 2.0 decoder.
+
+Eurostat (and other statistics offices) return a cube as one flat `value`
+array or dict plus the size and categories of every dimension. Instead of
+decoding every key in a Python loop, the flat positions are unravelled over
+the dimension sizes with numpy, and each dimension becomes a categorical
+column backed by small integer codes, so memory grows with the number of
+cells and not with the length of their labels.
+"""
+import numpy as np
+import pandas as pd
+
+# Number of cells unravelled at once; bounds the temporary index arrays
+CHUNK_SIZE = 1_000_000
+
+
+def _code_dtype(size):
+    for dtype in (np.int8, np.int16, np.int32):
+        if size <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _categories(dimension, use_labels):
+    """Category codes (or labels) of one dimension, in index order"""
+    category = dimension['category']
+    index = category.get('index')
+    if index is None:
+        codes = list(category['label'])
+    elif isinstance(index, list):
+        codes = index
+    else:
+        codes = sorted(index, key=index.get)
+
+    if not use_labels or 'label' not in category:
+        return codes
+    labels = [category['label'].get(code, code) for code in codes]
+    # Categoricals need unique categories; fall back to codes when labels collide
+    return labels if len(set(labels)) == len(labels) else codes
+
+
+def _flat_values(values):
+    """Flat cell positions and float values, with missing cells dropped"""
+    if isinstance(values, dict):
+        positions = np.fromiter(map(int, values.keys()), dtype=np.int64, count=len(values))
+        observations = np.array(list(values.values()), dtype='float64')
+    else:
+        observations = np.array(values, dtype='float64')
+        positions = np.arange(len(observations), dtype=np.int64)
+
+    present = ~np.isnan(observations)
+    return positions[present], observations[present]
+
+
+def decode(data, labels=True, chunk_size=CHUNK_SIZE):
+    """
+    Decode a JSON-stat dataset into a tidy frame: one categorical column per
+    dimension plus a float 'value' column. Missing cells are left out.
+    With labels=False the dimension columns hold category codes instead of labels.
+    """
+    dimension_ids = data.get('id') or list(data['dimension'])
+    sizes = data.get('size') or [
+        len(_categories(data['dimension'][dim], False)) for dim in dimension_ids
+    ]
+    positions, observations = _flat_values(data['value'])
+
+    codes = [np.empty(len(positions), dtype=_code_dtype(size)) for size in sizes]
+    for start in range(0, len(positions), chunk_size):
+        chunk = np.unravel_index(positions[start:start + chunk_size], sizes)
+        for out, dim_codes in zip(codes, chunk):
+            out[start:start + len(dim_codes)] = dim_codes
+
+    columns = {}
+    for dim, dim_codes in zip(dimension_ids, codes):
+        categories = _categories(data['dimension'][dim], labels)
+        columns[dim] = pd.Categorical.from_codes(dim_codes, categories=categories)
+    columns['value'] = observations
+    return pd.DataFrame(columns)
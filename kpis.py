@@ -0,0 +1,63 @@
+"""
+Headline indicators (KPIs) shown at the top of the dashboard pages.
+
+Every figure is derived from the datasets under Data/, and the whole set is
+computed once per data version (see loaders.get_kpis) instead of on every
+rerun of every page.
+"""
+import dataversion
+import population
+
+# Datasets the KPIs are derived from; their fingerprints make up the KPI version
+KPI_DATASETS = ('gdp', 'real_wage', 'life_expectancy', 'population')
+
+# Data/population.xlsx holds the age structure of the latest census (see population.write_age_groups)
+POPULATION_YEAR = max(population.SOURCES)
+
+
+def data_version():
+    return tuple(dataversion.version(name) for name in KPI_DATASETS)
+
+
+def format_population(count):
+    return f"{count / 1e6:.1f}M"
+
+
+def compute_kpis(gdp_df, wage_df, life_df, population_df):
+    """
+    Compute every headline figure.
+    Returns name -> {'value', 'display', 'label'}; 'value' is the raw number.
+    """
+    population = int(population_df['Total_count'].sum())
+
+    latest_gdp = gdp_df.iloc[-1]
+    gdp_per_capita = latest_gdp['gdp_current_usd'] / population
+
+    latest_wage = wage_df.iloc[-1]
+    real_wage = latest_wage['Real Average Wage (RON) - 2023 prices']
+
+    life_total = life_df[life_df['Sex'] == 'Total'].iloc[-1]
+    life_expectancy = life_total['Life_Expectancy']
+
+    return {
+        'population': {
+            'value': population,
+            'display': format_population(population),
+            'label': f"Population ({POPULATION_YEAR})",
+        },
+        'gdp_per_capita': {
+            'value': float(gdp_per_capita),
+            'display': f"${gdp_per_capita:,.0f}",
+            'label': f"GDP per Capita ({int(latest_gdp['year'])}, USD)",
+        },
+        'real_wage': {
+            'value': float(real_wage),
+            'display': f"{real_wage:,.0f} RON",
+            'label': f"Real Average Wage ({int(latest_wage['Year'])})",
+        },
+        'life_expectancy': {
+            'value': float(life_expectancy),
+            'display': f"{life_expectancy:.1f}",
+            'label': f"Life Expectancy ({int(life_total['Year'])}, years)",
+        },
+    }
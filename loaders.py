@@ -0,0 +1,246 @@
+"""
+Cached data loaders and figures shared by the dashboard pages.
+
+Imported once per process, so the cache definitions are not re-executed on every rerun.
+Datasets and figures are held once per process and shared by every session.
+Every cache is keyed on the data version of its inputs (see dataversion.py), so
+rewritten files under Data/ are served without restarting the server. Results
+that are not compiled ahead of time are also kept on disk (see persist.py) and
+read back after a restart.
+"""
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+import charts
+import cpi
+import datastore
+import dataversion
+import figures
+import instrumentation
+import kpis
+import peers
+import persist
+import population
+
+logger = logging.getLogger(__name__)
+
+# Keep the data versions current for the lifetime of the server
+dataversion.start()
+
+
+# Compiled figures, loaded once per chart version and shared by every session (see figures.SharedFigure)
+@st.cache_resource(max_entries=32, show_spinner=False)
+def load_chart(name, version):
+    instrumentation.cache_miss()
+    # A chart that has to be rebuilt reads its data from the shared datasets below
+    return figures.load_figure(name, version, load=lambda dataset: load_dataset(dataset, dataversion.version(dataset)))
+
+
+@instrumentation.timed('figure', cached=True)
+def get_chart(name):
+    """Return the ready-built figure for a chart, see figures.py"""
+    return load_chart(name, figures.figure_version(name))
+
+
+# Headline KPIs, computed once per data version
+@st.cache_data(max_entries=4, show_spinner=False)
+@persist.cached(persist.JSON)
+def load_kpis(version):
+    instrumentation.cache_miss()
+    return kpis.compute_kpis(*[load_dataset(name, v) for name, v in zip(kpis.KPI_DATASETS, version)])
+
+
+@instrumentation.timed('load', cached=True)
+def get_kpis():
+    """Return every headline figure, see kpis.py"""
+    return load_kpis(kpis.data_version())
+
+
+# Parsed datasets, held once per process and shared read-only by every session,
+# one entry per data version. Unlike st.cache_data nothing is pickled or copied per call.
+@st.cache_resource(max_entries=16, show_spinner=False)
+def load_shared_dataset(name, version):
+    instrumentation.cache_miss()
+    return datastore.SharedFrame(datastore.load(name))
+
+
+def load_dataset(name, version):
+    """Zero-copy view of a shared dataset, see datastore.SharedFrame"""
+    return load_shared_dataset(name, version).view()
+
+
+# Loads the sources of a page concurrently on a cold cache
+_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='rofacts-loader')
+
+# (loader, *args) -> object prefetch() loaded. Weak, so an entry goes away
+# once the shared cache drops the object (evicted or cleared) and is fetched again.
+_prefetched = weakref.WeakValueDictionary()
+
+
+def _run_in_session(ctx, func, *args):
+    # Cached functions look up the script context of the session that asked for them
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return func(*args)
+
+
+@instrumentation.timed('load', cached=True)
+def prefetch(datasets=(), charts=(), population_cube=False):
+    """
+    Load the datasets, compiled charts and population cube a page needs up front,
+    the missing ones concurrently, so a cold page costs about as much as its
+    slowest source. The page's own loader calls then hit the shared caches; a
+    source that fails here is left for them to load again and report.
+    """
+    jobs = [(load_shared_dataset, name, dataversion.version(name)) for name in datasets]
+    jobs += [(load_chart, name, figures.figure_version(name)) for name in charts]
+    if population_cube:
+        jobs.append((load_population_cube, population.cube_version()))
+    missing = [job for job in jobs if job not in _prefetched]
+    if not missing:
+        return
+    instrumentation.cache_miss()
+
+    ctx = get_script_run_ctx()
+    futures = {_pool.submit(_run_in_session, ctx, *job): job for job in missing}
+    wait(futures)
+    for future, job in futures.items():
+        if future.exception() is None:
+            _prefetched[job] = future.result()
+        else:
+            logger.warning("Prefetching %s%s failed: %s", job[0].__name__, job[1:], future.exception())
+
+
+# Life Expectancy Functions
+@instrumentation.timed('load', cached=True)
+def load_life_expectancy_data():
+    #file_path = r'C:\Users\Svitlana\OneDrive\RoFacts\mvp\data\life_expectancy.xlsx'
+    return load_dataset('life_expectancy', dataversion.version('life_expectancy'))
+
+
+# Load wage data
+@instrumentation.timed('load', cached=True)
+def load_wage_data():
+    #return pd.read_csv(r'C:\Users\Svitlana\OneDrive\RoFacts\mvp\data\real_wage.csv')
+    return load_dataset('real_wage', dataversion.version('real_wage'))
+
+
+# Load GDP data from the compiled store instead of API (already limited to 1990-2025 and sorted)
+@instrumentation.timed('load', cached=True)
+def load_gdp_data():
+    #df = pd.read_csv(r'C:\Users\Svitlana\OneDrive\RoFacts\mvp\data\gdp.csv')
+    return load_dataset('gdp', dataversion.version('gdp'))
+
+
+# Cumulative price index behind the real wage series, rebuilt only when the wage data changes
+@st.cache_resource(max_entries=4, show_spinner=False)
+def load_price_index(version):
+    instrumentation.cache_miss()
+    wage_df = datastore.load('real_wage')
+    return cpi.PriceIndex.from_rates(wage_df['Year'].to_numpy(), wage_df['Inflation'].to_numpy(), percent=True)
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+@persist.cached(persist.FIGURE)
+def build_repriced_wage_chart(base_year, version):
+    """Real wage chart at the prices of any base year, repriced from the precomputed index"""
+    instrumentation.cache_miss()
+    wage_df = load_wage_data()
+    repriced = pd.DataFrame({
+        'Year': wage_df['Year'],
+        f'Real Average Wage (RON) - {base_year} prices': load_price_index(version).reprice(wage_df['Average wage (RON)'], base_year),
+    })
+    return figures.SharedFigure.from_figure(charts.create_wage_chart(repriced, base_year))
+
+
+@instrumentation.timed('figure', cached=True)
+def get_wage_chart(base_year=2023):
+    # Data/real_wage.csv already holds 2023 prices, served from the compiled figure
+    if base_year == 2023:
+        return get_chart('wage')
+    return build_repriced_wage_chart(base_year, dataversion.version('real_wage'))
+
+
+@instrumentation.timed('load', cached=True)
+def load_monthly_wage_data():
+    return load_dataset('monthly_wage', dataversion.version('monthly_wage'))
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+@persist.cached(persist.FIGURE)
+def build_monthly_wage_chart(start_year, end_year, version):
+    instrumentation.cache_miss()
+    return figures.SharedFigure.from_figure(charts.create_monthly_wage_chart(load_monthly_wage_data(), start_year, end_year))
+
+
+@instrumentation.timed('figure', cached=True)
+def get_monthly_wage_chart(start_year, end_year):
+    """Monthly real wage chart for a range of years; the full range is served from the compiled figure"""
+    monthly_df = load_monthly_wage_data()
+    with instrumentation.span('monthly wage years', 'filter'):
+        years = monthly_df['Month'].dt.year
+    if (start_year, end_year) == (years.min(), years.max()):
+        return get_chart('monthly_wage')
+    return build_monthly_wage_chart(start_year, end_year, dataversion.version('monthly_wage'))
+
+
+# Population cube (see population.py), memory-mapped once per version of its sources
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_population_cube(version):
+    instrumentation.cache_miss()
+    return population.load_cube(version)
+
+
+@instrumentation.timed('load', cached=True)
+def get_population_cube():
+    return load_population_cube(population.cube_version())
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+@persist.cached(persist.FIGURE)
+def build_population_pyramid_years(starts, version):
+    """Pyramid of every year in the cube in the age bands starting at `starts`, one animation frame per year"""
+    instrumentation.cache_miss()
+    frames = population.pyramid_frames(load_population_cube(version), starts)
+    return figures.SharedFigure.from_figure(charts.create_population_pyramid_years(frames))
+
+
+@instrumentation.timed('figure', cached=True)
+def get_population_pyramid_years(starts=None):
+    """Multi-year pyramid in the age bands starting at `starts` (default: five-year groups)"""
+    return build_population_pyramid_years(tuple(starts) if starts else None, population.cube_version())
+
+
+# GDP per capita of every economy with its ranks and EU index (see peers.py), built once per data version
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_peer_comparison(version):
+    instrumentation.cache_miss()
+    return peers.PeerComparison(load_dataset('gdp_per_capita', version))
+
+
+@instrumentation.timed('load', cached=True)
+def get_peer_comparison():
+    return load_peer_comparison(dataversion.version('gdp_per_capita'))
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+@persist.cached(persist.FIGURE)
+def build_peer_chart(codes, measure, version):
+    """Romania and the peers `codes` on one measure of peers.MEASURES"""
+    instrumentation.cache_miss()
+    comparison = load_peer_comparison(version)
+    attribute, axis_title = peers.MEASURES[measure]
+    home = comparison.names[comparison.rows([peers.HOME])[0]]
+    return figures.SharedFigure.from_figure(charts.create_peer_chart(
+        comparison.series((peers.HOME,) + codes, measure), axis_title, home,
+        reverse=attribute == 'ranks', reference=100 if attribute == 'eu_index' else None))
+
+
+@instrumentation.timed('figure', cached=True)
+def get_peer_chart(codes, measure):
+    return build_peer_chart(tuple(codes), measure, dataversion.version('gdp_per_capita'))
@@ -0,0 +1,104 @@
+"""
+Romania against peer countries: GDP per capita (PPP) comparison.
+
+The gdp_per_capita dataset (see worldbank.FEEDS) is held as a country x year
+matrix with a country-code index. Yearly ranks, percentiles and the level
+relative to the EU average of every economy are computed in one vectorized
+pass when the matrix is built, so comparing Romania with any set of peers,
+up to every economy the World Bank reports, only selects rows.
+
+The EU average is the World Bank's European Union aggregate (EUU), which
+only the feed over every economy brings. Without it (e.g. the ten-country
+draft the dataset started from) ranks among a handful of economies and an
+EU average of a few members would mislead, so only the values are offered.
+"""
+import numpy as np
+import pandas as pd
+
+HOME = 'ROU'
+EU_AGGREGATE = 'EUU'
+EU_MEMBERS = (
+    'AUT', 'BEL', 'BGR', 'CYP', 'CZE', 'DEU', 'DNK', 'ESP', 'EST', 'FIN', 'FRA', 'GRC', 'HRV', 'HUN',
+    'IRL', 'ITA', 'LTU', 'LUX', 'LVA', 'MLT', 'NLD', 'POL', 'PRT', 'ROU', 'SVK', 'SVN', 'SWE',
+)
+DEFAULT_PEERS = ('DEU', 'FRA', 'ITA', 'POL', 'BGR', 'HUN')
+
+# Measure -> (attribute of PeerComparison, axis title); rank 1 is the highest, so the rank axis is drawn reversed.
+# All but the first need every economy and the EU aggregate in the data (see PeerComparison.measures).
+MEASURES = {
+    'GDP per capita': ('values', 'GDP per capita, PPP (constant international $)'),
+    'EU average = 100': ('eu_index', 'GDP per capita, EU average = 100'),
+    'Rank': ('ranks', 'Rank among economies'),
+    'Percentile': ('percentiles', 'Percentile among economies'),
+}
+
+
+class PeerComparison:
+    """
+    GDP per capita of every economy and year, with its yearly rank (1 = highest),
+    percentile (share of economies at or below it) and level relative to the EU
+    average (EU = 100) as matrices [country, year]; NaN where there is no value.
+    """
+
+    def __init__(self, df, value_column='gdp_per_capita_ppp'):
+        matrix = df.pivot(index='country_code', columns='year', values=value_column)
+        names = df.drop_duplicates('country_code').set_index('country_code')['country']
+
+        # Without the aggregate the data is not the feed over every economy: values only
+        self.complete = EU_AGGREGATE in matrix.index
+        if self.complete:
+            eu_average = matrix.loc[EU_AGGREGATE]
+            matrix = matrix.drop(EU_AGGREGATE)
+        else:
+            eu_average = matrix.loc[matrix.index.intersection(EU_MEMBERS)].mean()
+
+        self.codes = matrix.index
+        self.names = names.reindex(self.codes).to_numpy()
+        self.years = matrix.columns.to_numpy()
+        self.values = matrix.to_numpy()
+        self.eu_average = eu_average.to_numpy()
+
+        # Every economy and year at once; aggregates other than the EU are not in the data
+        self.counts = matrix.notna().sum().to_numpy()
+        self.ranks = matrix.rank(ascending=False, method='min').to_numpy()
+        self.percentiles = matrix.rank(pct=True, method='max').to_numpy() * 100
+        self.eu_index = self.values / self.eu_average * 100
+
+    def measures(self):
+        """Measures of MEASURES the data supports"""
+        return list(MEASURES) if self.complete else list(MEASURES)[:1]
+
+    def rows(self, codes):
+        """Row positions of country codes in the matrices"""
+        positions = self.codes.get_indexer(list(codes))
+        if (positions < 0).any():
+            unknown = [code for code, position in zip(codes, positions) if position < 0]
+            raise KeyError(f"No GDP per capita data for {unknown}")
+        return positions
+
+    def countries(self):
+        """Country code -> name of every economy, by name"""
+        order = np.argsort(self.names.astype(str))
+        return dict(zip(self.codes[order], self.names[order]))
+
+    def series(self, codes, measure='GDP per capita'):
+        """Years x countries (by name) frame of one measure (see MEASURES) for the given codes"""
+        rows = self.rows(codes)
+        return pd.DataFrame(getattr(self, MEASURES[measure][0])[rows].T, index=self.years, columns=self.names[rows])
+
+    def year_table(self, codes, year):
+        """Every supported measure of one year for the given codes, best ranked first"""
+        rows = self.rows(codes)
+        column = int(np.searchsorted(self.years, year))
+        if column == len(self.years) or self.years[column] != year:
+            raise KeyError(f"No GDP per capita data for {year}")
+        table = pd.DataFrame({
+            'Country': self.names[rows],
+            'GDP per capita (PPP $)': self.values[rows, column],
+        })
+        if self.complete:
+            table['Rank'] = self.ranks[rows, column]
+            table['Of'] = self.counts[column]
+            table['Percentile'] = self.percentiles[rows, column]
+            table['EU average = 100'] = self.eu_index[rows, column]
+        return table.sort_values('GDP per capita (PPP $)', ascending=False).reset_index(drop=True)
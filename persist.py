@@ -0,0 +1,171 @@
+"""
+Persistent, content-addressed cache of derived results under Data/cache/.
+
+The Streamlit caches in loaders.py are emptied by every restart. Results that
+are expensive to recompute (figures at non-default settings, the KPIs) are
+also written here, so a restarted server reads them back instead of running
+pandas and Plotly again. Datasets and the default figures are already kept on
+disk by datastore.py and figures.py.
+
+A result is stored under a hash of the function, its arguments (which carry
+the data versions, see dataversion.py) and the code it is built with, so a
+new version of the data or of the code simply gets a new entry. Files are
+written to a temporary name and renamed, which makes writes atomic and safe
+with several server processes sharing the directory. The directory is
+bounded to MAX_BYTES: reads refresh a file's mtime, and the entries read
+least recently are removed first.
+
+Both can be set with the ROFACTS_CACHE_DIR and ROFACTS_CACHE_MAX_MB environment variables.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+
+import charts
+import cpi
+import datastore
+import downsample
+import figures
+import instrumentation
+import kpis
+import peers
+import population
+
+CACHE_DIR = os.environ.get('ROFACTS_CACHE_DIR', os.path.join(datastore.DATA_DIR, 'cache'))
+MAX_BYTES = int(float(os.environ.get('ROFACTS_CACHE_MAX_MB', 256)) * 2**20)
+
+logger = logging.getLogger(__name__)
+
+# Evictions of this process run one at a time; other processes may evict concurrently
+_evict_lock = threading.Lock()
+
+
+def _code_version():
+    digest = hashlib.sha1()
+    for module in (charts, cpi, datastore, downsample, figures, kpis, peers, population):
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Changes to the modules results are built with must invalidate them like changes to the data
+CODE_VERSION = _code_version()
+
+
+# How results are written to and read from a file: (suffix, dump to bytes, load from bytes)
+FIGURE = ('.json', lambda fig: fig.spec.encode(), lambda data: figures.SharedFigure(data.decode()))
+JSON = ('.json', lambda value: json.dumps(value).encode(), json.loads)
+
+
+def entry_key(func, source, args):
+    """Content address of func(*args): a hash of the code and of the arguments"""
+    digest = hashlib.sha1(CODE_VERSION.encode())
+    digest.update(source.encode())
+    digest.update(json.dumps([func.__module__, func.__qualname__, args], default=str).encode())
+    return digest.hexdigest()
+
+
+# Directories entries are sharded into: the first two hex digits of their key
+SHARD_PATTERN = re.compile(r'[0-9a-f]{2}')
+
+
+def entry_path(key, suffix):
+    # Two-level layout keeps directories small
+    return os.path.join(CACHE_DIR, key[:2], key + suffix)
+
+
+def read(path):
+    """Bytes of an entry, or None when it is not cached"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    try:
+        # Mark as recently used
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+
+def write(path, data):
+    """Write an entry atomically and evict old entries if the directory grew too large"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    evict()
+
+
+def evict(max_bytes=None):
+    """Remove the least recently used entries until the directory fits in max_bytes"""
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    with _evict_lock:
+        entries = []
+        for directory in os.scandir(CACHE_DIR):
+            # Only the shard directories of entry_path; Data/cache also holds e.g. worldbank/
+            if not directory.is_dir() or not SHARD_PATTERN.fullmatch(directory.name):
+                continue
+            for entry in os.scandir(directory.path):
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Evicted by another process in the meantime
+                pass
+            total -= size
+
+
+def cached(codec):
+    """
+    Decorator persisting a function's results on disk; `codec` is FIGURE or JSON.
+    The arguments must identify the result, data versions included.
+    """
+    suffix, dump, load = codec
+
+    def decorator(func):
+        source = inspect.getsource(func)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            path = entry_path(entry_key(func, source, args), suffix)
+            try:
+                data = read(path)
+                if data is not None:
+                    instrumentation.cache_miss('disk')
+                    return load(data)
+            except (OSError, ValueError):
+                logger.warning("Ignoring unreadable cache entry %s", path, exc_info=True)
+
+            value = func(*args)
+            try:
+                write(path, dump(value))
+            except OSError:
+                # Read-only checkout: keep the result in memory only
+                logger.debug("Could not write cache entry %s", path, exc_info=True)
+            return value
+        return wrapper
+    return decorator
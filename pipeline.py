@@ -0,0 +1,337 @@
+"""
+Incremental, parallel rebuild of everything under Data/.
+
+Replaces running the notebooks in Code/ by hand. Every step is a stage with
+declared inputs, outputs and the modules its code lives in:
+
+    real_wage, monthly_wage    Code/real_wage.ipynb, from Raw Data/average_wage.xlsx and inflation.xlsx (wages.py)
+    population                 Code/population.ipynb, Data/population.xlsx from the census (population.py)
+    population_cube            the compiled population cube (population.py)
+    gdp, life_expectancy       Code/gdp.ipynb and Code/life_expectancy.ipynb; they download, so
+                               they only run, and then always, with --fetch (worldbank.py, eurostat.py)
+    gdp_per_capita             GDP per capita of every economy for the peer comparison, also with --fetch
+    compile:<dataset>          the compiled Arrow file of every dataset (datastore.py)
+    figure:<name>              the compiled default figure of every chart (figures.py)
+
+A stage is rebuilt only when the content of one of its inputs or code files
+changed since its last run, or one of its outputs is missing or was changed by
+hand. The raw workbooks are read through rawdata.py, which streams only the
+columns the stages keep. Files are content-hashed, and a hash is only
+recomputed when the file's mtime or size changed, so a run with nothing to do
+reads no file and imports no pandas. Stages whose inputs are ready run concurrently in a process pool; a
+stage that fails skips the stages built from its outputs.
+
+The hashes of the last run are kept in Data/compiled/pipeline.json.
+
+Run `python pipeline.py` to bring Data/ up to date, `python pipeline.py --fetch`
+to download the remote datasets first, or name stages to rebuild only them and
+what they are built from (see --help).
+"""
+import argparse
+import fnmatch
+import glob
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_PATH = os.path.join(BASE_DIR, 'Data', 'compiled', 'pipeline.json')
+
+# Dataset name -> source file under Data/, as in datastore.DATASETS (not imported: it pulls in pandas)
+DATASET_SOURCES = {
+    'gdp': 'Data/gdp.csv',
+    'real_wage': 'Data/real_wage.csv',
+    'monthly_wage': 'Data/monthly_wage.csv',
+    'life_expectancy': 'Data/life_expectancy.xlsx',
+    'gdp_per_capita': 'Data/gdp_per_capita.csv',
+    'population': 'Data/population.xlsx',
+}
+
+# Chart name -> datasets it is built from, as in figures.FIGURES
+FIGURE_DATASETS = {
+    'wage': ('real_wage',),
+    'monthly_wage': ('monthly_wage',),
+    'gdp': ('gdp',),
+    'population_pyramid': ('population',),
+    'life_expectancy': ('life_expectancy',),
+}
+
+RAW_WAGES = ['Raw Data/average_wage.xlsx', 'Raw Data/inflation.xlsx']
+RAW_CENSUS = ['Raw Data/Population by age - absolut value.xls']
+
+# Stage name -> inputs, outputs (glob patterns allowed), code files and the function it runs
+# ('module:function' with args); paths are relative to the repository.
+# A stage with fetch=True downloads its output and only runs with --fetch, but then always does.
+STAGES = {
+    'gdp': {
+        'inputs': [],
+        'outputs': [DATASET_SOURCES['gdp']],
+        'code': ['worldbank.py'],
+        'run': ('worldbank:refresh', [['gdp']]),
+        'fetch': True,
+    },
+    'gdp_per_capita': {
+        'inputs': [],
+        'outputs': [DATASET_SOURCES['gdp_per_capita']],
+        'code': ['worldbank.py'],
+        'run': ('worldbank:refresh', [['gdp_per_capita']]),
+        'fetch': True,
+    },
+    'life_expectancy': {
+        'inputs': [],
+        'outputs': [DATASET_SOURCES['life_expectancy']],
+        'code': ['eurostat.py', 'jsonstat.py'],
+        'run': ('eurostat:write_life_expectancy', []),
+        'fetch': True,
+    },
+    'real_wage': {
+        'inputs': RAW_WAGES,
+        'outputs': [DATASET_SOURCES['real_wage']],
+        'code': ['cpi.py', 'datastore.py', 'rawdata.py', 'wages.py'],
+        'run': ('wages:write_real_wages', []),
+    },
+    'monthly_wage': {
+        'inputs': RAW_WAGES,
+        'outputs': [DATASET_SOURCES['monthly_wage']],
+        'code': ['cpi.py', 'datastore.py', 'rawdata.py', 'wages.py'],
+        'run': ('wages:write_monthly_wages', []),
+    },
+    'population': {
+        'inputs': RAW_CENSUS,
+        'outputs': [DATASET_SOURCES['population']],
+        'code': ['datastore.py', 'population.py', 'rawdata.py'],
+        'run': ('population:write_age_groups', []),
+    },
+    'population_cube': {
+        'inputs': RAW_CENSUS,
+        'outputs': ['Data/compiled/population_cube.npy', 'Data/compiled/population_cube.json'],
+        'code': ['population.py', 'rawdata.py'],
+        'run': ('population:compile_cube', []),
+    },
+}
+for _name, _source in DATASET_SOURCES.items():
+    STAGES[f'compile:{_name}'] = {
+        'inputs': [_source],
+        'outputs': [f'Data/compiled/{_name}.arrow'],
+        'code': ['datastore.py'],
+        'run': ('datastore:compile_dataset', [_name]),
+    }
+for _name, _datasets in FIGURE_DATASETS.items():
+    STAGES[f'figure:{_name}'] = {
+        'inputs': [DATASET_SOURCES[dataset] for dataset in _datasets],
+        'outputs': [f'Data/compiled/figures/{_name}.*.json'],
+        'code': ['charts.py', 'datastore.py', 'downsample.py', 'figures.py'],
+        'run': ('figures:compile_figure', [_name]),
+    }
+
+
+def dependencies(name):
+    """Stages producing the inputs of a stage"""
+    inputs = STAGES[name]['inputs']
+    return [other for other, stage in STAGES.items() if other != name and any(
+        fnmatch.fnmatch(path, pattern) for path in inputs for pattern in stage['outputs'])]
+
+
+class FileHashes:
+    """Content hashes of files, recomputed only when a file's mtime or size changed"""
+
+    def __init__(self, known=None):
+        # relative path -> [mtime_ns, size, sha1]
+        self.known = known or {}
+
+    def hash(self, path):
+        """Hash of a file, or None when it does not exist"""
+        try:
+            stat = os.stat(os.path.join(BASE_DIR, path))
+        except FileNotFoundError:
+            self.known.pop(path, None)
+            return None
+        cached = self.known.get(path)
+        if cached and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return cached[2]
+        with open(os.path.join(BASE_DIR, path), 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        self.known[path] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def outputs(self, patterns):
+        """Path -> hash of every file matching the output patterns; None if a pattern matches nothing"""
+        hashes = {}
+        for pattern in patterns:
+            paths = sorted(os.path.relpath(path, BASE_DIR) for path in glob.glob(os.path.join(BASE_DIR, pattern)))
+            if not paths:
+                return None
+            for path in paths:
+                hashes[path] = self.hash(path)
+        return hashes
+
+
+def stage_key(name, hashes):
+    """Hash of what a stage is built from: its function, code and inputs; None if an input is missing"""
+    stage = STAGES[name]
+    digest = hashlib.sha1(json.dumps([name, stage['run']]).encode())
+    for path in stage['code'] + stage['inputs']:
+        file_hash = hashes.hash(path)
+        if file_hash is None:
+            return None
+        digest.update(f'{path}:{file_hash};'.encode())
+    return digest.hexdigest()
+
+
+def load_state():
+    try:
+        with open(STATE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'files': {}, 'stages': {}}
+
+
+def save_state(state):
+    os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+    tmp_path = f'{STATE_PATH}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, STATE_PATH)
+
+
+def run_stage(target, args):
+    """Run a stage's function in a worker process; returns how long it took in ms"""
+    start = time.perf_counter()
+    module, function = target.split(':')
+    sys.path.insert(0, BASE_DIR)
+    getattr(importlib.import_module(module), function)(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def select(names, fetch):
+    """The stages to consider: `names` (all by default) and every stage they are built from"""
+    selected = set()
+    pending = list(names or STAGES)
+    while pending:
+        name = pending.pop()
+        if name in selected:
+            continue
+        selected.add(name)
+        pending.extend(dependencies(name))
+    # Without --fetch the downloaded files are taken as they are
+    return [name for name in STAGES if name in selected and (fetch or not STAGES[name].get('fetch'))]
+
+
+def is_current(name, key, state, hashes):
+    """True when the stage was last run on the same key and its outputs are still the ones it wrote"""
+    if STAGES[name].get('fetch'):
+        # Built from what the server has now, which no key covers: fetching always downloads again
+        return False
+    last = state['stages'].get(name)
+    return bool(last) and last['key'] == key and hashes.outputs(STAGES[name]['outputs']) == last['outputs']
+
+
+def run(names=None, fetch=False, force=False, workers=None, dry_run=False, report=print):
+    """
+    Bring the selected stages up to date, running independent stages concurrently.
+    Returns stage name -> 'ran' ('stale' in a dry run), 'current', 'failed' or 'skipped'
+    (an input failed or is missing).
+    """
+    stages = select(names, fetch)
+    deps = {name: [dep for dep in dependencies(name) if dep in stages] for name in stages}
+    state = load_state()
+    hashes = FileHashes(state['files'])
+    results = {}
+    running = {}
+    pool = None
+
+    try:
+        while len(results) < len(stages):
+            for name in stages:
+                if name in results or name in running.values() or any(dep not in results for dep in deps[name]):
+                    continue
+                if any(results[dep] in ('failed', 'skipped') for dep in deps[name]):
+                    results[name] = 'skipped'
+                    report(f"{name}: skipped, an input failed")
+                    continue
+                key = stage_key(name, hashes)
+                if key is None:
+                    results[name] = 'skipped'
+                    report(f"{name}: skipped, missing input or code file")
+                elif not force and is_current(name, key, state, hashes):
+                    results[name] = 'current'
+                elif dry_run:
+                    # Stages built from it are listed too: its output is expected to change
+                    results[name] = 'stale'
+                    report(f"{name}: would run")
+                else:
+                    if pool is None:
+                        pool = ProcessPoolExecutor(max_workers=workers)
+                    running[pool.submit(run_stage, *STAGES[name]['run'])] = name
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    elapsed = future.result()
+                except Exception as e:
+                    results[name] = 'failed'
+                    state['stages'].pop(name, None)
+                    report(f"{name}: failed: {e}")
+                    continue
+                outputs = hashes.outputs(STAGES[name]['outputs'])
+                if outputs is None:
+                    results[name] = 'failed'
+                    report(f"{name}: failed: did not write {', '.join(STAGES[name]['outputs'])}")
+                    continue
+                results[name] = 'ran'
+                state['stages'][name] = {'key': stage_key(name, hashes), 'outputs': outputs}
+                # Saved after every stage, so an interrupted run keeps what it finished
+                save_state(state)
+                report(f"{name}: ran in {elapsed:.1f} ms")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if 'ran' not in results.values():
+        # Refresh the stat cache of files touched without being changed
+        try:
+            save_state(state)
+        except OSError:
+            pass
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the files under Data/ whose inputs changed")
+    parser.add_argument('stages', nargs='*', help="stages to bring up to date, with the stages they are built from (default: all)")
+    parser.add_argument('--fetch', action='store_true', help=f"also download {', '.join(n for n, s in STAGES.items() if s.get('fetch'))}")
+    parser.add_argument('--force', action='store_true', help="rebuild the stages even if they are up to date")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--dry-run', action='store_true', help="only list the stages that would run")
+    parser.add_argument('--list', action='store_true', help="list the stages and what they are built from")
+    args = parser.parse_args()
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+    if args.list:
+        for name, stage in STAGES.items():
+            print(f"{name}: {', '.join(stage['inputs']) or 'download'} -> {', '.join(stage['outputs'])}")
+        return
+
+    start = time.perf_counter()
+    results = run(args.stages, args.fetch or any(STAGES[name].get('fetch') for name in args.stages),
+                  args.force, args.workers, args.dry_run)
+    elapsed = (time.perf_counter() - start) * 1000
+    counts = {status: list(results.values()).count(status) for status in ('ran', 'stale', 'current', 'failed', 'skipped')}
+    ran = f"{counts['stale']} would run" if args.dry_run else f"{counts['ran']} ran"
+    print(f"{ran}, {counts['current']} up to date, {counts['failed']} failed, "
+          f"{counts['skipped']} skipped in {elapsed:.1f} ms")
+    if counts['failed']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Population by year, single year of age and sex as one dense array.
+
+Every census year in SOURCES is compiled into a cube of head counts indexed
+[year, age, sex], written to Data/compiled/population_cube.npy with its axes
+in population_cube.json. The dashboard memory-maps the file, so the pyramid
+of any year is a slice of the array: no spreadsheet is read and no DataFrame
+is rebuilt when the year changes. Ages are kept one by one, with their prefix
+sums per year and sex, so the pyramid can show any grouping of ages (1-, 5-,
+10-year bands, the dependency-ratio split) at the cost of one subtraction
+per band.
+
+The only age structure collected so far is the 2021 census (Raw
+Data/Population by age - absolut value.xls). Data/population.xlsx is the same
+census summed into five-year groups and Raw Data/Population by age -
+percentage.xlsx gives it as shares, so neither adds a year; a table for
+another year in the same layout is added to rawdata.RAW_TABLES and SOURCES.
+
+Run `python population.py` to rebuild the cube.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+import datastore
+import rawdata
+
+# Year -> raw census table (see rawdata.RAW_TABLES) of the resident population by sex and single year of age
+SOURCES = {
+    2021: 'census_2021',
+}
+
+CUBE_PATH = os.path.join(datastore.COMPILED_DIR, 'population_cube.npy')
+AXES_PATH = os.path.join(datastore.COMPILED_DIR, 'population_cube.json')
+
+# Ages 0..100; the census counts everyone aged 100 and over as 100
+OPEN_AGE = 100
+SEXES = ('Male', 'Female')
+
+# Five-year groups of the pyramid, the last one open-ended, as in Data/population.xlsx
+GROUP_WIDTH = 5
+OLDEST_GROUP = 90
+
+# Working ages (start, end) of the usual dependency ratio: 15 to 64
+WORKING_AGES = (15, 65)
+
+
+def read_census(name):
+    """
+    Head counts [age, sex] of a raw census table. Every age has one row per year
+    of birth; the age label is only on the first one.
+    """
+    df = rawdata.load(name)
+    df['age'] = df['age'].ffill()
+    # Age labels are 'Sub 1 an' (under one), '1 an', '2 ani', ..., '100 ani si peste'
+    df = df[df['age'].astype(str).str.match(r'(Sub 1 an|\d+ an)') & df['male'].notna()]
+
+    ages = df['age'].map(lambda label: int(re.match(r'\d+', label).group()) if label[0].isdigit() else 0)
+    counts = np.zeros((OPEN_AGE + 1, len(SEXES)), dtype='int64')
+    np.add.at(counts, np.minimum(ages.to_numpy(), OPEN_AGE), df[['male', 'female']].to_numpy(dtype='int64'))
+    return counts
+
+
+def cube_version():
+    """Hash of the versions of every source; a change to any of them rebuilds the cube"""
+    digest = hashlib.sha1()
+    for year, name in sorted(SOURCES.items()):
+        digest.update(f'{year}:{rawdata.compiled_version(name)};'.encode())
+    return digest.hexdigest()[:16]
+
+
+def band_label(start, end):
+    """Label of the ages start..end-1; end=None for an open-ended band"""
+    if end is None:
+        return f'{start}+'
+    return str(start) if end - start == 1 else f'{start} - {end - 1}'
+
+
+class PopulationCube:
+    """
+    Head counts indexed [year, age, sex]; counts is read-only (usually memory-mapped).
+    The prefix sums over age are computed once, so any grouping of ages into bands
+    is a difference of two rows per band instead of a pass over every age.
+    """
+
+    def __init__(self, years, counts):
+        self.years = list(years)
+        self.counts = counts
+        # cumulative[year, age, sex]: head count of everyone younger than age, for age 0..OPEN_AGE + 1
+        self.cumulative = np.zeros((counts.shape[0], counts.shape[1] + 1, counts.shape[2]), dtype='int64')
+        np.cumsum(counts, axis=1, out=self.cumulative[:, 1:])
+
+    def year(self, year):
+        """Head counts [age, sex] of one year, a view of the cube"""
+        return self.counts[self.years.index(year)]
+
+    def bands(self, starts):
+        """
+        Labels and head counts [year, band, sex] of the age bands starting at `starts`,
+        ascending from 0; the last band is open-ended. O(number of bands).
+        """
+        starts = list(starts)
+        if not starts or starts[0] != 0 or starts[-1] > OPEN_AGE or any(b <= a for a, b in zip(starts, starts[1:])):
+            raise ValueError(f"Age bands must start at 0 and increase up to {OPEN_AGE}, got {starts}")
+        ends = starts[1:] + [OPEN_AGE + 1]
+        labels = [band_label(start, end) for start, end in zip(starts[:-1], ends)] + [band_label(starts[-1], None)]
+        return labels, self.cumulative[:, ends] - self.cumulative[:, starts]
+
+    def age_groups(self, width=GROUP_WIDTH, oldest=OLDEST_GROUP):
+        """Labels and head counts [year, group, sex] of `width`-year groups up to an open-ended `oldest`+ group"""
+        return self.bands(range(0, oldest + 1, width))
+
+    def dependency_ratio(self, working_ages=WORKING_AGES):
+        """Per year, people younger or older than working age per 100 people of working age (start..end-1)"""
+        _, counts = self.bands((0, *working_ages))
+        young, working, old = counts.sum(axis=2).T
+        return (young + old) / working * 100
+
+
+def build_cube():
+    years = sorted(SOURCES)
+    counts = np.stack([read_census(SOURCES[year]) for year in years])
+    if (counts < 0).any():
+        raise ValueError("negative head counts in the population sources")
+    return PopulationCube(years, counts)
+
+
+def write_cube(cube, version):
+    """Write the counts, then their axes: the axes file marks the cube as complete"""
+    os.makedirs(datastore.COMPILED_DIR, exist_ok=True)
+    tmp_path = f'{CUBE_PATH}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.save(f, np.ascontiguousarray(cube.counts))
+    os.replace(tmp_path, CUBE_PATH)
+
+    axes = {'version': version, 'years': cube.years, 'ages': OPEN_AGE + 1, 'sexes': list(SEXES)}
+    tmp_path = f'{AXES_PATH}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(axes, f)
+    os.replace(tmp_path, AXES_PATH)
+
+
+def read_cube(version):
+    """Memory-map the compiled cube; None when it is missing or was built from other sources"""
+    try:
+        with open(AXES_PATH, encoding='utf-8') as f:
+            axes = json.load(f)
+        if axes['version'] != version:
+            return None
+        counts = np.load(CUBE_PATH, mmap_mode='r')
+    except (OSError, ValueError, KeyError):
+        return None
+    if counts.shape != (len(axes['years']), OPEN_AGE + 1, len(SEXES)):
+        return None
+    return PopulationCube(axes['years'], counts)
+
+
+def load_cube(version=None):
+    """Load the population cube, rebuilding it from the sources when stale"""
+    version = version or cube_version()
+    cube = read_cube(version)
+    if cube is not None:
+        return cube
+
+    cube = build_cube()
+    try:
+        write_cube(cube, version)
+    except OSError:
+        # Read-only checkout: serve the cube from memory
+        pass
+    cube.counts.flags.writeable = False
+    return cube
+
+
+def pyramid_frames(cube, starts=None):
+    """
+    Year -> age bands (default: five-year groups) of that year in the layout of
+    Data/population.xlsx (oldest band first, counts and shares of the year's
+    population), for the pyramid builder
+    """
+    labels, counts = cube.bands(starts) if starts else cube.age_groups()
+    frames = {}
+    for year, year_counts in zip(cube.years, counts):
+        shares = year_counts / year_counts.sum()
+        frames[year] = pd.DataFrame({
+            'Age_group': labels[::-1],
+            'Male_Count': year_counts[::-1, 0],
+            'Female_Count': year_counts[::-1, 1],
+            'Total_count': year_counts[::-1].sum(axis=1),
+            'Male_Percent': shares[::-1, 0],
+            'Female_Percent': shares[::-1, 1],
+        })
+    return frames
+
+
+def compile_cube():
+    """Build the cube from the sources and write it"""
+    cube = build_cube()
+    write_cube(cube, cube_version())
+    return cube
+
+
+def write_age_groups():
+    """
+    Rebuild Data/population.xlsx, the five-year groups of the latest year (see
+    kpis.py and the population_pyramid figure), from the cube
+    """
+    cube = build_cube()
+    datastore.write_source('population', pyramid_frames(cube)[cube.years[-1]])
+
+
+def main():
+    start = time.perf_counter()
+    cube = compile_cube()
+    elapsed = (time.perf_counter() - start) * 1000
+    totals = ', '.join(f'{year}: {total:,}' for year, total in zip(cube.years, cube.counts.sum(axis=(1, 2))))
+    print(f"population cube: {cube.counts.shape} -> {os.path.relpath(CUBE_PATH, datastore.BASE_DIR)} ({totals}) ({elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+Streaming ingestion of the raw INS workbooks under Raw Data/.
+
+The workbooks hold far more than the pipeline keeps: average_wage.xlsx has the
+twelve months, a yearly average and the annual wage, and the census tables
+split every count by urban and rural residence. pd.read_excel builds a frame
+of every cell before the unused columns are dropped. read_table instead
+streams the rows of one sheet and keeps only the requested columns:
+
+- .xlsx: the sheet's XML is decompressed in chunks, the cells past the last
+  kept column are cut out of each chunk by a regular expression (a scan in C)
+  and only the rest is parsed, so parse time follows the kept cells, plus one
+  pass over the bytes.
+- .xls: xlrd loads only the requested sheet, but every cell of it, so only
+  memory (the values built) follows the kept cells.
+
+Every table in RAW_TABLES is converted once into the compiled store, as
+Data/compiled/raw/<name>.arrow, and read back from there until the workbook or
+the table's spec changes (see datastore.file_fingerprint).
+
+Run `python rawdata.py` to (re)build every compiled raw table.
+"""
+import hashlib
+import json
+import os
+import posixpath
+import re
+import time
+import zipfile
+from contextlib import contextmanager
+from xml.etree import ElementTree
+
+import pandas as pd
+
+import datastore
+
+RAW_DIR = os.path.join(datastore.BASE_DIR, 'Raw Data')
+RAW_COMPILED_DIR = os.path.join(datastore.COMPILED_DIR, 'raw')
+
+# Bytes of a sheet's XML decompressed and parsed at a time
+XLSX_CHUNK = 1 << 16
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'Maz', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Table name -> workbook under Raw Data/, sheet (name or index), header row (0-based; None when the
+# columns are picked by position), columns kept (header name or position -> column name) and their types.
+# Numeric columns turn text cells (titles, notes) into NaN; str columns keep empty cells as None.
+RAW_TABLES = {
+    'average_wage': {
+        'source': 'average_wage.xlsx',
+        'sheet': 0,
+        'header': 0,
+        # 'Maz' is how the workbook spells May
+        'columns': {name: name for name in ['Year'] + MONTHS + ['Average wage (RON)']},
+        'dtypes': {'Year': 'int64', **{month: 'float64' for month in MONTHS}, 'Average wage (RON)': 'float64'},
+    },
+    'inflation': {
+        'source': 'inflation.xlsx',
+        'sheet': 0,
+        'header': 0,
+        'columns': {'Year': 'Year', 'Inflation': 'Inflation'},
+        'dtypes': {'Year': 'int64', 'Inflation': 'float64'},
+    },
+    'census_2021': {
+        'source': 'Population by age - absolut value.xls',
+        'sheet': 0,
+        'header': None,
+        # Columns A (age), 2 (males) and 3 (females) of the whole country, urban and rural together
+        'columns': {0: 'age', 3: 'male', 4: 'female'},
+        'dtypes': {'age': 'str', 'male': 'float64', 'female': 'float64'},
+    },
+}
+
+
+def source_path(name):
+    return os.path.join(RAW_DIR, RAW_TABLES[name]['source'])
+
+
+def compiled_path(name):
+    return os.path.join(RAW_COMPILED_DIR, f'{name}.arrow')
+
+
+def compiled_version(name):
+    """Fingerprint of the workbook and a hash of the table's spec"""
+    spec = json.dumps(RAW_TABLES[name], sort_keys=True).encode()
+    return f'{datastore.file_fingerprint(source_path(name))}-{hashlib.sha1(spec).hexdigest()[:8]}'
+
+
+def _local_name(tag):
+    """Tag without its namespace: transitional and strict workbooks use different ones"""
+    return tag.rpartition('}')[2]
+
+
+def _column_letters(position):
+    """'A' for column 0, 'AA' for column 26"""
+    letters = ''
+    position += 1
+    while position:
+        position, remainder = divmod(position - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _column_position(ref):
+    """0-based column of a cell reference such as 'AB12'"""
+    position = 0
+    for letter in ref.rstrip('0123456789'):
+        position = position * 26 + ord(letter) - 64
+    return position - 1
+
+
+def _relationships(book, part):
+    """Relationship id -> (type, path in the archive) of a part of an .xlsx package"""
+    folder, name = posixpath.split(part)
+    try:
+        data = book.read(posixpath.join(folder, '_rels', f'{name}.rels'))
+    except KeyError:
+        return {}
+    return {rel.get('Id'): (rel.get('Type'), rel.get('Target').lstrip('/') if rel.get('Target').startswith('/')
+                            else posixpath.normpath(posixpath.join(folder, rel.get('Target'))))
+            for rel in ElementTree.fromstring(data)}
+
+
+def _xlsx_parts(book, sheet):
+    """Paths of a sheet (name or index) and of the shared strings (None if there are none) in an .xlsx package"""
+    workbook = next(path for kind, path in _relationships(book, '').values() if kind.endswith('/officeDocument'))
+    related = _relationships(book, workbook)
+    sheets = [element for element in ElementTree.fromstring(book.read(workbook)).iter()
+              if _local_name(element.tag) == 'sheet']
+    found = sheets[sheet] if isinstance(sheet, int) else next(
+        (element for element in sheets if element.get('name') == sheet), None)
+    if found is None:
+        raise KeyError(f"Worksheet {sheet} does not exist")
+    rel_id = next(value for key, value in found.attrib.items() if _local_name(key) == 'id')
+    strings = next((path for kind, path in related.values() if kind.endswith('/sharedStrings')), None)
+    return related[rel_id][1], strings
+
+
+def _text(element):
+    """Text of a string item: its <t>, or its rich text runs, leaving out phonetic runs"""
+    return ''.join(t.text or '' for child in element if _local_name(child.tag) in ('t', 'r')
+                   for t in child.iter() if _local_name(t.tag) == 't')
+
+
+def _shared_strings(book, path):
+    if path is None:
+        return []
+    strings = []
+    with book.open(path) as f:
+        for _, element in ElementTree.iterparse(f):
+            if _local_name(element.tag) == 'si':
+                strings.append(_text(element))
+                element.clear()
+    return strings
+
+
+def _cell_value(cell, strings):
+    """Value of a <c> element, as openpyxl gives it with data_only, except that dates stay Excel serial numbers"""
+    kind = cell.get('t', 'n')
+    if kind == 'inlineStr':
+        return next((_text(child) for child in cell if _local_name(child.tag) == 'is'), None)
+    value = next((child.text for child in cell if _local_name(child.tag) == 'v'), None)
+    if value is None:
+        return None
+    if kind == 's':
+        return strings[int(value)]
+    if kind == 'b':
+        return value == '1'
+    if kind != 'n':
+        # Formula strings, errors ('#N/A') and ISO dates
+        return value
+    return float(value) if '.' in value or 'E' in value or 'e' in value else int(value)
+
+
+def _xlsx_rows(f, strings, last_column):
+    """(0-based row, values) of every row of a sheet's XML holding a cell, up to last_column"""
+    unused = None
+    if last_column is not None:
+        # Cells past the last kept column, removed from the XML before it is parsed. Only a whole
+        # <c r="..."> element of another column can match (text never holds '<'), so whatever is
+        # not matched, e.g. a cell split over two chunks, is parsed and dropped below instead.
+        kept = b'|'.join(_column_letters(position).encode() for position in range(last_column + 1))
+        unused = re.compile(rb'<c r="(?!(?:' + kept + rb')[0-9])[A-Z]+[0-9]+"[^>]*?(?:/>|>.*?</c>)', re.S)
+
+    parser = ElementTree.XMLPullParser(('end',))
+    index = -1
+    for chunk in iter(lambda: f.read(XLSX_CHUNK), b''):
+        parser.feed(unused.sub(b'', chunk) if unused else chunk)
+        for _, element in parser.read_events():
+            if _local_name(element.tag) != 'row':
+                continue
+            index = int(element.get('r')) - 1 if element.get('r') else index + 1
+            values = {}
+            column = -1
+            for cell in element:
+                column = _column_position(cell.get('r')) if cell.get('r') else column + 1
+                if last_column is None or column <= last_column:
+                    values[column] = _cell_value(cell, strings)
+            element.clear()
+            width = last_column + 1 if last_column is not None else max(values, default=-1) + 1
+            yield index, tuple(values.get(column) for column in range(width))
+
+
+@contextmanager
+def _xlsx_sheet(path, sheet):
+    """
+    rows(first, count, last_column) of one sheet of an .xlsx workbook, parsed
+    from its XML without building the cells past last_column
+    """
+    with zipfile.ZipFile(path) as book:
+        sheet_path, strings_path = _xlsx_parts(book, sheet)
+        strings = _shared_strings(book, strings_path)
+
+        def rows(first=0, count=None, last_column=None):
+            stop = None if count is None else first + count
+            expected = first
+            with book.open(sheet_path) as f:
+                for index, values in _xlsx_rows(f, strings, last_column):
+                    if stop is not None and index >= stop:
+                        break
+                    if index < first:
+                        continue
+                    # Empty rows are left out of the XML
+                    for _ in range(expected, index):
+                        yield ()
+                    yield values
+                    expected = index + 1
+        yield rows
+
+
+@contextmanager
+def _xls_sheet(path, sheet):
+    """rows(first, count, last_column) of one sheet of an .xls workbook; the other sheets are never parsed"""
+    import xlrd
+
+    book = xlrd.open_workbook(path, on_demand=True)
+    try:
+        worksheet = book.sheet_by_index(sheet) if isinstance(sheet, int) else book.sheet_by_name(sheet)
+
+        def rows(first=0, count=None, last_column=None):
+            last_row = worksheet.nrows if count is None else min(first + count, worksheet.nrows)
+            end = worksheet.ncols if last_column is None else min(last_column + 1, worksheet.ncols)
+            for row in range(first, last_row):
+                # xlrd returns '' for an empty cell
+                yield tuple(value if value != '' else None for value in worksheet.row_values(row, 0, end))
+        yield rows
+    finally:
+        book.release_resources()
+
+
+def read_table(path, columns, sheet=0, header=None, dtypes=None):
+    """
+    Stream one sheet of an .xls or .xlsx workbook, keeping only `columns`
+    (header name or 0-based position -> column name). With `header`, the
+    columns are looked up in that row and the rows after it are data.
+    Rows with none of the kept columns filled are dropped.
+    """
+    open_sheet = _xls_sheet if path.lower().endswith('.xls') else _xlsx_sheet
+    kept = {name: [] for name in columns.values()}
+
+    with open_sheet(path, sheet) as rows:
+        if header is None:
+            positions, first = list(columns), 0
+        else:
+            labels = [str(label).strip() if label is not None else None for label in next(rows(header, 1), ())]
+            missing = [name for name in columns if name not in labels]
+            if missing:
+                raise ValueError(f"Columns {missing} not found in row {header} of {os.path.basename(path)}")
+            positions, first = [labels.index(name) for name in columns], header + 1
+
+        for row in rows(first, last_column=max(positions)):
+            values = [row[position] if position < len(row) else None for position in positions]
+            if all(value is None for value in values):
+                continue
+            for name, value in zip(kept, values):
+                kept[name].append(value)
+
+    df = pd.DataFrame(kept)
+    for name, dtype in (dtypes or {}).items():
+        if dtype == 'str':
+            df[name] = df[name].map(lambda value: None if pd.isna(value) else str(value)).astype('object')
+        else:
+            df[name] = pd.to_numeric(df[name], errors='coerce').astype(dtype)
+    return df
+
+
+def read_source(name):
+    """Stream the kept columns of a raw table out of its workbook"""
+    spec = RAW_TABLES[name]
+    return read_table(source_path(name), spec['columns'], spec['sheet'], spec['header'], spec['dtypes'])
+
+
+def compile_table(name):
+    """Parse one raw table, write it to the compiled store and return the frame"""
+    version = compiled_version(name)
+    df = read_source(name)
+    datastore.write_arrow(compiled_path(name), df, version)
+    return df
+
+
+def load(name):
+    """Load a raw table from the compiled store, streaming it out of its workbook when stale"""
+    version = compiled_version(name)
+    df = datastore.read_arrow(compiled_path(name), version)
+    if df is not None:
+        return df
+
+    df = read_source(name)
+    try:
+        datastore.write_arrow(compiled_path(name), df, version)
+    except OSError:
+        # Read-only checkout: keep serving straight from the workbook
+        pass
+    return df
+
+
+def main():
+    for name in RAW_TABLES:
+        start = time.perf_counter()
+        df = compile_table(name)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{name}: {len(df)} rows x {len(df.columns)} columns -> "
+              f"{os.path.relpath(compiled_path(name), datastore.BASE_DIR)} ({elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
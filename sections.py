@@ -0,0 +1,167 @@
+"""
+Chart blocks shared by the dashboard pages.
+
+Every block is a fragment (see instrumentation.fragment) holding one chart and
+its own controls: changing a control reruns only that block, not rofacts.py
+with the sidebar, the KPIs and the other charts of the page.
+"""
+import streamlit as st
+
+import peers
+import population
+from instrumentation import fragment, span
+from loaders import (get_chart, get_monthly_wage_chart, get_peer_chart, get_peer_comparison, get_population_cube,
+                     get_population_pyramid_years, get_wage_chart, load_monthly_wage_data, load_wage_data)
+from ui import plotly_chart
+
+# Age bands offered on the population pyramid -> first age of every band (see population.PopulationCube.bands);
+# None splits young, working-age and old people at the working ages picked on a slider
+AGE_BANDS = {
+    '5 years': tuple(range(0, population.OLDEST_GROUP + 1, 5)),
+    '10 years': tuple(range(0, population.OLDEST_GROUP + 1, 10)),
+    '1 year': tuple(range(0, population.OPEN_AGE + 1)),
+    'Dependency ratio': None,
+}
+
+
+@fragment
+def wage_chart(controls=False):
+    """Real wage chart; with controls, at the prices of a base year picked by the user"""
+    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+
+    try:
+        base_year = 2023
+        if controls:
+            wage_df = load_wage_data()
+            with span('wage years', 'filter'):
+                wage_years = wage_df['Year'].tolist()
+            base_year = st.selectbox('Price base year', wage_years, index=len(wage_years) - 1, key='wage_base_year')
+        fig_wage = get_wage_chart(base_year)
+        plotly_chart(fig_wage, 'wage')
+
+    except Exception as e:
+        st.error(f"Error loading wage data: {str(e)}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@fragment
+def gdp_chart():
+    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+
+    try:
+        fig_gdp = get_chart('gdp').with_layout(height=500)
+        plotly_chart(fig_gdp, 'gdp')
+
+    except Exception as e:
+        st.error(f"Error loading GDP data: {str(e)}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@fragment
+def monthly_wage_chart():
+    """Monthly real wage chart, decimated to the years picked on its slider"""
+    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+
+    try:
+        monthly_wage_df = load_monthly_wage_data()
+        with span('monthly wage years', 'filter'):
+            month_years = monthly_wage_df['Month'].dt.year
+            first_year, last_year = int(month_years.min()), int(month_years.max())
+        start_year, end_year = st.slider('Years shown', first_year, last_year, (first_year, last_year), key='monthly_wage_years')
+        fig_monthly_wage = get_monthly_wage_chart(start_year, end_year)
+        plotly_chart(fig_monthly_wage, 'monthly_wage')
+
+    except Exception as e:
+        st.error(f"Error loading monthly wage data: {str(e)}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@fragment
+def population_pyramid(controls=False):
+    """
+    Population pyramid; with controls, of every year in the population cube
+    (behind a year slider) in the age bands picked by the user
+    """
+    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+
+    try:
+        if not controls:
+            plotly_chart(get_chart('population_pyramid'), 'population_pyramid')
+        else:
+            banding = st.radio('Age bands', list(AGE_BANDS), horizontal=True, key='population_age_bands')
+            starts = AGE_BANDS[banding]
+            if starts is None:
+                first, last = st.slider('Working age', 1, population.OPEN_AGE - 1,
+                                        (population.WORKING_AGES[0], population.WORKING_AGES[1] - 1),
+                                        key='population_working_ages')
+                starts = (0, first, last + 1)
+            plotly_chart(get_population_pyramid_years(starts), 'population_pyramid')
+
+            if banding == 'Dependency ratio':
+                cube = get_population_cube()
+                ratios = cube.dependency_ratio((first, last + 1))
+                st.caption(' | '.join(
+                    f"Dependency ratio {year}: {ratio:.1f} people under {first} or over {last} per 100 aged {first}-{last}"
+                    for year, ratio in zip(cube.years, ratios)
+                ))
+
+    except Exception as e:
+        st.error(f"Error loading population data: {str(e)}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@fragment
+def life_expectancy_chart():
+    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+
+    try:
+        fig_life_expectancy = get_chart('life_expectancy')
+        plotly_chart(fig_life_expectancy, 'life_expectancy')
+
+    except Exception as e:
+        st.error(f"Error loading life expectancy data: {str(e)}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@fragment
+def peer_comparison():
+    """
+    GDP per capita of Romania against the peers picked by the user, on the measure
+    picked (see peers.MEASURES), and the table of one year of every measure
+    """
+    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+
+    try:
+        comparison = get_peer_comparison()
+        countries = comparison.countries()
+        countries.pop(peers.HOME, None)
+        codes = st.multiselect('Peers', list(countries), [code for code in peers.DEFAULT_PEERS if code in countries],
+                               format_func=countries.get, key='peer_countries')
+        measure = st.radio('Measure', comparison.measures(), horizontal=True, key='peer_measure')
+        plotly_chart(get_peer_chart(codes, measure), 'peer_comparison')
+
+        years = comparison.years.tolist()
+        year = st.select_slider('Year', years, years[-1], key='peer_year')
+        st.dataframe(comparison.year_table([peers.HOME] + codes, year), hide_index=True, width='stretch',
+                     column_config={
+                         'GDP per capita (PPP $)': st.column_config.NumberColumn(format='%,.0f'),
+                         'Rank': st.column_config.NumberColumn(format='%d'),
+                         'Percentile': st.column_config.NumberColumn(format='%.0f'),
+                         'EU average = 100': st.column_config.NumberColumn(format='%.1f'),
+                     })
+        if comparison.complete:
+            st.caption(f"Ranks and percentiles among the {comparison.counts[years.index(year)]} economies with data "
+                       f"in {year}; EU average: World Bank European Union aggregate")
+        else:
+            st.caption("Ranks, percentiles and the EU average are shown once the data covers every economy "
+                       "(`python pipeline.py gdp_per_capita`)")
+
+    except Exception as e:
+        st.error(f"Error loading GDP per capita data: {str(e)}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,31 @@
+"""
+Server entry point of the dashboard: rofacts.py with its caches warmed at startup.
+
+Run `streamlit run server.py` (as the devcontainer does). The warm-up (see
+warmup.py) starts as soon as the server is up, before the first session
+connects, and GET /api/ready answers 200 once it is done (503 until then),
+for a load balancer or deploy script to wait on.
+"""
+from contextlib import asynccontextmanager
+
+import streamlit as st
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+# warmup (and loaders behind it) is imported once the Streamlit runtime has started:
+# st.cache_data functions defined before that would not use the runtime's cache storage
+@asynccontextmanager
+async def lifespan(app):
+    import warmup
+    warmup.start()
+    yield
+
+
+async def readiness(request):
+    import warmup
+    return JSONResponse({'ready': warmup.ready.is_set(), 'timings_ms': dict(warmup.timings)},
+                        status_code=200 if warmup.ready.is_set() else 503)
+
+
+app = st.App('rofacts.py', lifespan=lifespan, routes=[Route('/api/ready', readiness)])
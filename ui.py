@@ -0,0 +1,93 @@
+"""
+Small HTML building blocks shared by the dashboard pages.
+"""
+import logging
+
+import streamlit as st
+
+import figures
+import instrumentation
+
+try:
+    # Internals behind st.plotly_chart, used to send the prebuilt spec of a SharedFigure
+    from streamlit.elements.lib.form_utils import current_form_id
+    from streamlit.elements.lib.layout_utils import LayoutConfig
+    from streamlit.elements.lib.utils import compute_and_register_element_id
+    from streamlit.elements.plotly_chart import _resolve_content_height
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+except ImportError:
+    # Moved in another Streamlit version: SharedFigures go through st.plotly_chart
+    PlotlyChartProto = None
+
+logger = logging.getLogger(__name__)
+
+# Set once sending a prebuilt spec failed (e.g. after an internal signature change), to warn only once
+_spec_failed = False
+
+
+def data_source_footer():
+    """Data sources footer shown on every page with charts"""
+    st.markdown('<p class="data-source">Data Sources: Romanian National Institute of Statistics (INS) for wage, population, and life expectancy data | GDP from World Bank API</p>',
+                unsafe_allow_html=True)
+
+
+def kpi_boxes(kpis, names):
+    """Row of KPI boxes for the given names of a kpis.compute_kpis() result"""
+    boxes = ''.join(f"""
+    <div class="kpi-box">
+        <div class="kpi-value">{kpis[name]['display']}</div>
+        <div class="kpi-label">{kpis[name]['label']}</div>
+    </div>""" for name in names)
+    st.markdown(f'<div class="kpi-container">{boxes}\n</div>', unsafe_allow_html=True)
+
+
+def _send_spec(fig):
+    """
+    Full-width chart of a SharedFigure, sending its JSON spec as is: what
+    st.plotly_chart does for a chart without selections, minus converting,
+    validating and encoding the figure again on every rerun. Returns False,
+    having sent nothing, when the Streamlit internals it uses do not fit.
+    """
+    global _spec_failed
+    if PlotlyChartProto is None:
+        return False
+    try:
+        dg = st._main
+        proto = PlotlyChartProto()
+        proto.theme = 'streamlit'
+        proto.form_id = current_form_id(dg)
+        proto.spec = fig.spec
+        proto.config = '{}'
+        layout_config = LayoutConfig(width='stretch', height=_resolve_content_height('content', fig.figure_dict))
+        # Registered last: nothing may fail between registering the element and sending it
+        proto.id = compute_and_register_element_id(
+            'plotly_chart',
+            user_key=None,
+            key_as_main_identity=False,
+            dg=dg,
+            plotly_spec=proto.spec,
+            plotly_config=proto.config,
+            selection_mode=('points', 'box', 'lasso'),
+            is_selection_activated=False,
+            theme='streamlit',
+            width='stretch',
+            height='content',
+            alt=None,
+        )
+    except Exception:
+        if not _spec_failed:
+            logger.warning("Cannot send a prebuilt Plotly spec; using st.plotly_chart", exc_info=True)
+            _spec_failed = True
+        return False
+    dg._enqueue('plotly_chart', proto, layout_config=layout_config)
+    return True
+
+
+def plotly_chart(fig, name):
+    """Full-width Plotly chart, timed as the render stage of the rerun"""
+    with instrumentation.span(name, 'render'):
+        if isinstance(fig, figures.SharedFigure):
+            if not _send_spec(fig):
+                st.plotly_chart(fig.figure_dict, width='stretch')
+        else:
+            st.plotly_chart(fig, width='stretch')
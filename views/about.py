@@ -0,0 +1,53 @@
+import streamlit as st
+
+st.markdown('<h1 class="main-title">About RoFacts</h1>', unsafe_allow_html=True)
+
+st.markdown("""
+### About This Dashboard
+
+RoFacts provides comprehensive insights into Romania's socio-economic development through interactive visualizations and key performance indicators.
+
+### Data Coverage
+
+**Economy Section:**
+- Real wages adjusted for inflation (1991-2023), yearly and monthly
+- GDP evolution showing economic growth (1990-2025)
+- Key economic milestones like EU accession in 2007
+
+**Health Section:**
+- Life expectancy trends by gender and overall (1990-2023)
+- Interactive toggles to view different demographic breakdowns
+
+**Population Section:**
+- Current population demographics with age and gender distribution
+- Population pyramid showing demographic structure and trends
+
+### Key Insights
+
+- **Economic Recovery**: Real wages reached 1991 levels again in 2005, showing the economic recovery after the 1990s transition
+- **EU Integration**: Romania's EU accession in 2007 marked a significant milestone in economic development
+- **Demographic Trends**: The population pyramid reveals aging demographic patterns common in developed European countries
+- **Health Improvements**: Life expectancy has steadily improved over time, with women consistently showing higher life expectancy than men
+- **Transformation**: All indicators reflect Romania's successful transformation from a communist to a market economy
+
+### Data Sources
+
+- **Romanian National Institute of Statistics (INS)**: Official source for wage, population, and life expectancy data
+- **World Bank**: GDP data from official World Bank databases
+- **Data Processing**: Real wages adjusted using Consumer Price Index to constant 2023 prices
+
+### Technical Notes
+
+- All monetary values are properly adjusted for inflation
+- GDP figures shown in current US dollars
+- Population data reflects the most recent official demographic statistics
+- Life expectancy calculations follow standard demographic methodologies
+
+### Future Enhancements
+
+Planned additions to RoFacts include:
+- Government spending analysis and budget allocation trends
+- Additional health indicators and healthcare system metrics
+- Regional demographic breakdowns
+- Comparative analysis with other EU countries
+""")
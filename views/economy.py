@@ -0,0 +1,35 @@
+import streamlit as st
+
+from kpis import KPI_DATASETS
+from loaders import get_kpis, prefetch
+from sections import gdp_chart, monthly_wage_chart, wage_chart
+from ui import data_source_footer, kpi_boxes
+
+# Main title only - same blue color as KPI numbers
+st.markdown('<h1 class="main-title">Economy - Romania Socio-Economic indicators</h1>', unsafe_allow_html=True)
+
+# Load every source of the page at once, concurrently on a cold cache
+prefetch(datasets=KPI_DATASETS + ('monthly_wage',), charts=['wage', 'gdp', 'monthly_wage'])
+
+# KPI Boxes, precomputed once per data version
+try:
+    kpi_boxes(get_kpis(), ['population', 'gdp_per_capita', 'real_wage'])
+except Exception as e:
+    st.error(f"Error loading KPI data: {str(e)}")
+
+# Create 1x2 layout; every chart is a fragment with its own controls (see sections.py),
+# so picking a base year or years only reruns that chart
+col1, col2 = st.columns(2)
+
+# Left - Real Wage Chart, at the prices of the selected base year
+with col1:
+    wage_chart(controls=True)
+
+# Right - GDP Chart
+with col2:
+    gdp_chart()
+
+# Second row - Monthly Real Wage Chart, decimated to the selected years
+monthly_wage_chart()
+
+data_source_footer()
@@ -0,0 +1,14 @@
+import streamlit as st
+
+st.markdown('<h1 class="main-title">Government Spending</h1>', unsafe_allow_html=True)
+st.info("Government spending data and visualizations will be added here.")
+
+# Placeholder content
+st.markdown("""
+### Coming Soon
+This section will include:
+- Government budget allocation
+- Public spending trends
+- Infrastructure investments
+- Social spending analysis
+""")
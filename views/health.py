@@ -0,0 +1,22 @@
+import streamlit as st
+
+from kpis import KPI_DATASETS
+from loaders import get_kpis, prefetch
+from sections import life_expectancy_chart
+from ui import data_source_footer, kpi_boxes
+
+st.markdown('<h1 class="main-title">Health Indicators</h1>', unsafe_allow_html=True)
+
+# Load every source of the page at once, concurrently on a cold cache
+prefetch(datasets=KPI_DATASETS, charts=['life_expectancy'])
+
+# KPI Boxes, precomputed once per data version
+try:
+    kpi_boxes(get_kpis(), ['life_expectancy'])
+except Exception as e:
+    st.error(f"Error loading KPI data: {str(e)}")
+
+# Life Expectancy Chart
+life_expectancy_chart()
+
+data_source_footer()
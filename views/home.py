@@ -0,0 +1,43 @@
+import streamlit as st
+
+from kpis import KPI_DATASETS
+from loaders import get_kpis, prefetch
+from sections import gdp_chart, life_expectancy_chart, population_pyramid, wage_chart
+from ui import data_source_footer, kpi_boxes
+
+# Main title only - same blue color as KPI numbers
+st.markdown('<h1 class="main-title">RoFacts - Romania Socio-Economic indicators</h1>', unsafe_allow_html=True)
+
+# Load every source of the page at once, concurrently on a cold cache
+prefetch(datasets=KPI_DATASETS, charts=['wage', 'gdp', 'population_pyramid', 'life_expectancy'])
+
+# KPI Boxes, precomputed once per data version
+try:
+    kpi_boxes(get_kpis(), ['population', 'gdp_per_capita', 'real_wage', 'life_expectancy'])
+except Exception as e:
+    st.error(f"Error loading KPI data: {str(e)}")
+
+# Create 2x2 layout, every chart a fragment of its own (see sections.py)
+# First row - Real Wage Chart and GDP Chart
+col1, col2 = st.columns(2)
+
+# Top Left - Real Wage Chart
+with col1:
+    wage_chart()
+
+# Top Right - GDP Chart
+with col2:
+    gdp_chart()
+
+# Second row - Population Pyramid and Life Expectancy Chart
+col3, col4 = st.columns(2)
+
+# Bottom Left - Population Pyramid
+with col3:
+    population_pyramid()
+
+# Bottom Right - Life Expectancy Chart
+with col4:
+    life_expectancy_chart()
+
+data_source_footer()
@@ -0,0 +1,16 @@
+import streamlit as st
+
+from loaders import prefetch
+from sections import peer_comparison
+from ui import data_source_footer
+
+st.markdown('<h1 class="main-title">Romania and its Peers - GDP per capita</h1>', unsafe_allow_html=True)
+
+# Load every source of the page at once, concurrently on a cold cache
+prefetch(datasets=('gdp_per_capita',))
+
+# Peers, measure and year are controls of the fragment (see sections.py): changing them
+# only selects rows of the precomputed comparison and reruns that block
+peer_comparison()
+
+data_source_footer()
@@ -0,0 +1,23 @@
+import streamlit as st
+
+from kpis import KPI_DATASETS
+from loaders import get_kpis, prefetch
+from sections import population_pyramid
+from ui import data_source_footer, kpi_boxes
+
+st.markdown('<h1 class="main-title">Population Demographics</h1>', unsafe_allow_html=True)
+
+# Load every source of the page at once, concurrently on a cold cache
+prefetch(datasets=KPI_DATASETS, population_cube=True)
+
+# KPI Boxes, precomputed once per data version
+try:
+    kpi_boxes(get_kpis(), ['population'])
+except Exception as e:
+    st.error(f"Error loading KPI data: {str(e)}")
+
+# Population Pyramid of every year with an age structure in age bands of the user's choice;
+# the year is scrubbed in the browser
+population_pyramid(controls=True)
+
+data_source_footer()
@@ -0,0 +1,104 @@
+"""
+Annual and monthly nominal and real average wage series.
+
+build_real_wages is Code/real_wage.ipynb: the annual average wage of
+Raw Data/average_wage.xlsx deflated with the annual rates of
+Raw Data/inflation.xlsx. build_monthly_wages keeps the twelve monthly columns
+and deflates them with a monthly price index interpolated from the same annual
+rates (no monthly inflation series is collected alongside them).
+
+Run `python wages.py` to rebuild Data/real_wage.csv and Data/monthly_wage.csv.
+"""
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import cpi
+import datastore
+import rawdata
+
+
+# Wages before the July 2005 redenomination are in old lei; 1 RON = 10,000 ROL
+REDENOMINATION_YEAR = 2005
+ROL_PER_RON = 10_000
+
+BASE_YEAR = 2023
+
+
+def build_real_wages(wage_df, inflation_df, base_year=BASE_YEAR):
+    """
+    Annual wage frame of Data/real_wage.csv: Year, nominal wage (RON), inflation (%),
+    the price index at first-year and at base-year prices, and the real wage at
+    base-year prices in whole RON.
+    wage_df has Year and 'Average wage (RON)'; inflation_df has Year and Inflation as a fraction.
+    """
+    df = wage_df[['Year', 'Average wage (RON)']].merge(inflation_df[['Year', 'Inflation']], on='Year', how='left')
+    if df['Inflation'].isna().any():
+        missing = df.loc[df['Inflation'].isna(), 'Year'].tolist()
+        raise ValueError(f"No inflation rate for {missing}")
+    df['Inflation'] = df['Inflation'] * 100
+
+    price_index = cpi.PriceIndex.from_rates(df['Year'].to_numpy(), df['Inflation'].to_numpy(), percent=True)
+    first_year = int(df['Year'].iloc[0])
+    df[f'CPI-{first_year}'] = price_index.rebase(first_year)
+    df[f'CPI-{base_year}'] = price_index.rebase(base_year)
+    # Whole RON, truncated as in the notebook
+    df[f'Real Average Wage (RON) - {base_year} prices'] = (df['Average wage (RON)'] / df[f'CPI-{base_year}']).astype('int64')
+    return df
+
+
+def build_monthly_wages(wage_df, inflation_df, base_year=BASE_YEAR):
+    """
+    Monthly wage frame with Month, nominal wage (RON), the price index (base year = 1)
+    and the real wage at base-year prices.
+    wage_df has Year and twelve month columns; inflation_df has Year and Inflation as a fraction.
+    """
+    wage_df = wage_df.sort_values('Year')
+    years = wage_df['Year'].to_numpy(dtype='int64')
+    if (np.diff(years) != 1).any():
+        raise ValueError("average wage years must be consecutive")
+
+    # The twelve columns after Year are Jan..Dec
+    nominal = wage_df.iloc[:, 1:13].to_numpy(dtype='float64')
+    nominal[years < REDENOMINATION_YEAR] /= ROL_PER_RON
+
+    inflation = inflation_df.set_index('Year')['Inflation'].reindex(years)
+    if inflation.isna().any():
+        missing = inflation[inflation.isna()].index.tolist()
+        raise ValueError(f"No inflation rate for {missing}")
+
+    price_index = cpi.PriceIndex.monthly_from_annual_rates(years, inflation.to_numpy())
+    df = pd.DataFrame({
+        'Month': price_index.periods.astype('datetime64[ns]'),
+        'Average wage (RON)': nominal.ravel(),
+        'CPI': price_index.rebase(base_year),
+        f'Real Average Wage (RON) - {base_year} prices': price_index.reprice(nominal.ravel(), base_year),
+    })
+    # Months not published yet are empty in the workbook
+    return df.dropna(subset=['Average wage (RON)']).reset_index(drop=True)
+
+
+def write_real_wages():
+    """Rebuild the source file of the real_wage dataset from the raw workbooks"""
+    datastore.write_source('real_wage', build_real_wages(rawdata.load('average_wage'), rawdata.load('inflation')))
+
+
+def write_monthly_wages():
+    """Rebuild the source file of the monthly_wage dataset from the raw workbooks"""
+    df = build_monthly_wages(rawdata.load('average_wage'), rawdata.load('inflation'))
+    datastore.write_source('monthly_wage', df.round({'CPI': 6, f'Real Average Wage (RON) - {BASE_YEAR} prices': 2}))
+
+
+def main():
+    for name, write in (('real_wage', write_real_wages), ('monthly_wage', write_monthly_wages)):
+        start = time.perf_counter()
+        write()
+        df = datastore.compile_dataset(name)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{name}: {len(df)} rows -> {os.path.relpath(datastore.source_path(name), datastore.BASE_DIR)} ({elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
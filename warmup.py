@@ -0,0 +1,75 @@
+"""
+Cache warm-up when the server starts.
+
+Without it the first visitor after a deploy pays for parsing every file under
+Data/ and building every figure. start() fills the shared caches of loaders.py
+in a background thread: every dataset, the headline KPIs and the default
+figure of every page, and logs how long each took. `ready` is set once all of
+them are loaded. A session that asks for a source while it is being warmed
+waits for that load instead of starting a second one.
+
+server.py starts the warm-up as soon as the server is up; rofacts.py starts it
+too (once per process) when the app is run as `streamlit run rofacts.py`.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.logger import get_logger
+
+import datastore
+import dataversion
+import figures
+import loaders
+
+# Streamlit's logger, so the timings show in the server console at --logger.level (info by default)
+logger = get_logger(__name__)
+
+# Set once every cache below has been filled
+ready = threading.Event()
+# step -> milliseconds it took, of the warm-up of this process
+timings = {}
+
+_lock = threading.Lock()
+_thread = None
+
+
+def _step(name, func, *args):
+    start = time.perf_counter()
+    func(*args)
+    timings[name] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("Warm-up: %s in %.1f ms", name, timings[name])
+
+
+def warm_up():
+    """Load every dataset, the KPIs and every compiled figure into the shared caches, concurrently"""
+    start = time.perf_counter()
+    steps = [(f'dataset {name}', loaders.load_shared_dataset, name, dataversion.version(name))
+             for name in datastore.DATASETS]
+    steps += [(f'figure {name}', loaders.load_chart, name, figures.figure_version(name)) for name in figures.FIGURES]
+    steps.append(('kpis', loaders.get_kpis))
+    steps.append(('population pyramid years', loaders.get_population_pyramid_years))
+    steps.append(('peer comparison', loaders.get_peer_comparison))
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=8, thread_name_prefix='rofacts-warmup') as pool:
+        futures = {pool.submit(_step, *step): step[0] for step in steps}
+    for future, name in futures.items():
+        if future.exception() is not None:
+            # Left cold: the page that needs it loads it again and reports the error
+            failed.append(name)
+            logger.warning("Warm-up of %s failed: %s", name, future.exception())
+
+    timings['total'] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("Warm-up done in %.1f ms%s", timings['total'], f", {len(failed)} failed" if failed else '')
+    ready.set()
+
+
+def start():
+    """Warm the caches in a background thread, once per process"""
+    global _thread
+    with _lock:
+        if _thread is not None:
+            return
+        _thread = threading.Thread(target=warm_up, name='rofacts-warmup', daemon=True)
+        _thread.start()
@@ -0,0 +1,207 @@
+"""
+Concurrent World Bank API ingestion.
+
+Fetches every indicator x country x page combination in a thread pool over one
+pooled HTTP session, keeps each response in an on-disk cache revalidated with
+ETag / Last-Modified, and publishes the result straight into the compiled
+data store.
+
+Run `python worldbank.py` to refresh every feed, or point --base-url at a
+local server replaying recorded World Bank JSON (benchmarks/bench_worldbank.py
+runs one over the responses in benchmarks/worldbank/).
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+import datastore
+
+BASE_URL = "https://api.worldbank.org/v2"
+CACHE_DIR = os.path.join(datastore.DATA_DIR, 'cache', 'worldbank')
+
+# Dataset name -> World Bank query and how the value column is stored. A feed over several
+# countries keeps id_columns to tell them apart; with 'all' countries the API also returns
+# regional and income-group aggregates, of which only keep_aggregates are kept.
+FEEDS = {
+    'gdp': {
+        'indicator': 'NY.GDP.MKTP.CD',
+        'countries': ['RO'],
+        'start_year': 1990,
+        'end_year': 2025,
+        'value_column': 'gdp_current_usd',
+    },
+    'gdp_per_capita': {
+        # GDP per capita, PPP (constant international $), of every economy and the EU (see peers.py)
+        'indicator': 'NY.GDP.PCAP.PP.KD',
+        'countries': ['all'],
+        'start_year': 1990,
+        'end_year': 2025,
+        'value_column': 'gdp_per_capita_ppp',
+        'id_columns': ['country', 'country_code'],
+        'keep_aggregates': ['EUU'],
+    },
+}
+
+
+class WorldBankClient:
+    def __init__(self, base_url=BASE_URL, cache_dir=CACHE_DIR, max_workers=8, per_page=1000, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.per_page = per_page
+        self.timeout = timeout
+
+        # One session for all threads, with a connection pool as large as the thread pool
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=3)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _cache_path(self, url, params):
+        key = json.dumps([url, sorted(params.items())])
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+    def get_json(self, url, params):
+        """GET a JSON document, reusing the cached copy when the server answers 304 Not Modified"""
+        path = self._cache_path(url, params)
+        cached = None
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                cached = json.load(f)
+
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached:
+            return cached['body']
+        response.raise_for_status()
+        body = response.json()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'body': body,
+            }, f)
+        os.replace(tmp_path, path)
+        return body
+
+    def get_page(self, indicator, country, start_year, end_year, page):
+        url = f"{self.base_url}/country/{country}/indicator/{indicator}"
+        params = {
+            'format': 'json',
+            'date': f'{start_year}:{end_year}',
+            'per_page': self.per_page,
+            'page': page,
+        }
+        return self.get_json(url, params)
+
+    def get_aggregates(self):
+        """ISO3 codes of the regions and income groups the API lists next to the economies"""
+        data = self.get_json(f"{self.base_url}/country", {'format': 'json', 'per_page': 1000})
+        return {item['id'] for item in data[1] if item['region']['value'] == 'Aggregates'}
+
+    def get_indicator_data(self, indicators, countries, start_year=1990, end_year=2025):
+        """
+        Fetch all indicators for all countries concurrently.
+        Returns a tidy frame with indicator, country, country_code, year and value columns.
+        """
+        combos = [(indicator, country) for indicator in indicators for country in countries]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # The first page of every combination tells how many more pages there are
+            first_pages = list(pool.map(
+                lambda combo: self.get_page(*combo, start_year, end_year, 1), combos
+            ))
+            jobs = [
+                (indicator, country, page)
+                for (indicator, country), first in zip(combos, first_pages)
+                for page in range(2, _page_count(first) + 1)
+            ]
+            other_pages = list(pool.map(
+                lambda job: self.get_page(job[0], job[1], start_year, end_year, job[2]), jobs
+            ))
+
+        records = []
+        for data in first_pages + other_pages:
+            # The API returns metadata in first element, actual data in second
+            if len(data) < 2 or not data[1]:
+                continue
+            for item in data[1]:
+                if item['value'] is None:
+                    continue
+                records.append({
+                    'indicator': item['indicator']['id'],
+                    'country': item['country']['value'],
+                    'country_code': item['countryiso3code'],
+                    'year': int(item['date']),
+                    'value': float(item['value']),
+                })
+
+        columns = ['indicator', 'country', 'country_code', 'year', 'value']
+        df = pd.DataFrame(records, columns=columns)
+        return df.sort_values(['indicator', 'country_code', 'year']).reset_index(drop=True)
+
+
+def _page_count(data):
+    if not data or not isinstance(data[0], dict):
+        return 1
+    return int(data[0].get('pages') or 1)
+
+
+def refresh(names=None, client=None, publish=datastore.publish):
+    """
+    Fetch the given feeds (all by default) and publish them with
+    `publish` (dataset name, frame), by default into the compiled store
+    """
+    client = client or WorldBankClient()
+    frames = {}
+    for name in names or FEEDS:
+        feed = FEEDS[name]
+        df = client.get_indicator_data([feed['indicator']], feed['countries'], feed['start_year'], feed['end_year'])
+        if df.empty:
+            raise Exception(f"No data returned from API for {name}")
+
+        if 'keep_aggregates' in feed:
+            df = df[~df['country_code'].isin(client.get_aggregates() - set(feed['keep_aggregates']))]
+        df = df[feed.get('id_columns', []) + ['year', 'value']].rename(columns={'value': feed['value_column']})
+        frames[name] = publish(name, df)
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the World Bank datasets in Data/")
+    parser.add_argument('feeds', nargs='*', help=f"feeds to refresh, from {', '.join(FEEDS)} (default: all)")
+    parser.add_argument('--base-url', default=BASE_URL)
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+    unknown = set(args.feeds) - set(FEEDS)
+    if unknown:
+        parser.error(f"unknown feed(s): {', '.join(sorted(unknown))}")
+
+    client = WorldBankClient(args.base_url, args.cache_dir, max_workers=args.workers)
+    start = time.perf_counter()
+    frames = refresh(args.feeds, client)
+    elapsed = (time.perf_counter() - start) * 1000
+    for name, df in frames.items():
+        print(f"{name}: {len(df)} rows")
+    print(f"Refreshed {len(frames)} feed(s) in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()